@@ -0,0 +1,51 @@
+"""
+Animation timelines for Chain
+
+An Animation is a fixed tuple of pre-rendered frames plus how many ticks
+each frame stays on screen. Animated objects keep an integer tick and look
+their image up, so nothing is drawn or allocated while they animate.
+"""
+
+from sprites import get_sprite, create_coin_sprite
+
+
+class Animation:
+    """A looping sequence of pre-rendered frames"""
+    
+    __slots__ = ('frames', 'frame_duration')
+    
+    def __init__(self, frames, frame_duration=1):
+        self.frames = tuple(frames)
+        self.frame_duration = frame_duration
+    
+    @classmethod
+    def still(cls, image):
+        """A one-frame animation, for objects that don't animate."""
+        return cls((image,))
+    
+    def __len__(self):
+        """Ticks in one full loop."""
+        return len(self.frames) * self.frame_duration
+    
+    def frame_at(self, tick):
+        """The frame shown at a tick count."""
+        return self.frames[tick // self.frame_duration % len(self.frames)]
+
+
+# Shared animations, built on first use (once the display exists)
+ANIMATIONS = {
+    'coin': lambda: Animation([create_coin_sprite(width) for width in (8, 6, 4, 6)], 5),
+    'fireball': lambda: Animation([get_sprite('fireball', 'fly', frame=f) for f in (0, 2)], 2),
+    'thunder': lambda: Animation([get_sprite('thunder', 'strike', frame=f) for f in (0, 2)], 2),
+    'shield': lambda: Animation([get_sprite('shield', 'shimmer', frame=f) for f in range(10)]),
+}
+
+_animations = {}
+
+
+def get_animation(name):
+    """The shared Animation registered under name in ANIMATIONS."""
+    animation = _animations.get(name)
+    if animation is None:
+        animation = _animations[name] = ANIMATIONS[name]()
+    return animation
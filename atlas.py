@@ -0,0 +1,240 @@
+"""
+Sprite atlas for Chain
+
+Every sprite the game can ask sprites.py for comes from a finite set of
+variants. The atlas renders them all once at startup and packs them into
+a single surface, which is what gets cached and shipped. Installing it
+pins a standalone display-format copy of each sprite into the sprite
+cache: those blit faster than subsurfaces of one big surface.
+
+The baked atlas is saved to .cache/ as a PNG plus a JSON index, keyed by a
+hash of the sprite code and palette, so later launches just load it.
+Run this file to compare cold (bake) and warm (load) startup times.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import pygame
+import settings
+import sprites
+from sprites import sprite_cache, finalize_surface
+
+
+ATLAS_WIDTH = 512
+ATLAS_PADDING = 1  # Transparent gap between packed sprites, in unscaled pixels
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+TILE_VARIANTS = {
+    'grass': range(4),
+    'dirt': (0,),
+    'stone': (0,),
+    'brick': (0,),
+    'wood': (0,),
+    'water': range(8),
+    'lava': (0,),
+    'sky': (0, 1),
+}
+
+WORLD_TILE_TYPES = ('grass', 'forest', 'mountain', 'water', 'path', 'castle',
+                    'cave', 'fortress', 'boss', 'level_marker')
+
+
+def sprite_variants():
+    """Yield (factory name, args) for every sprite variant the game uses."""
+    for facing_right in (True, False):
+        for frame in (0, 1):
+            yield 'create_chain_sprite', (facing_right, frame)
+            yield 'create_knight_sprite', (facing_right, frame)
+        yield 'create_chain_attack_sprite', (facing_right,)
+        yield 'create_chain_up_attack_sprite', (facing_right,)
+        yield 'create_chain_down_attack_sprite', (facing_right,)
+
+    for facing in ('down', 'up', 'left', 'right'):
+        for frame in (0, 10):
+            yield 'create_chain_world_sprite', (facing, frame)
+
+    for frame in (0, 10):
+        yield 'create_slime_sprite', (frame,)
+    for frame in (0, 5):
+        yield 'create_bat_sprite', (frame,)
+    for frame in (0, 15):
+        yield 'create_cannon_sprite', (frame,)
+    for frame in (0, 2):
+        yield 'create_fireball_sprite', (frame,)
+        yield 'create_thunder_sprite', (frame,)
+    for frame in range(10):
+        yield 'create_shield_effect_sprite', (frame,)
+
+    for full, extra in ((True, False), (False, False), (True, True)):
+        yield 'create_heart_sprite', (full, extra)
+        yield 'create_magic_sprite', (full, extra)
+    for food_type in ('food', 'feast'):
+        yield 'create_food_sprite', (food_type,)
+    for vial_type in ('magic_vial', 'magic_potion'):
+        yield 'create_magic_vial_sprite', (vial_type,)
+    for width in (8, 6, 4):
+        yield 'create_coin_sprite', (width,)
+    yield 'create_key_sprite', ()
+
+    for tile_type, variants in TILE_VARIANTS.items():
+        for variant in variants:
+            yield 'create_tile_sprite', (tile_type, variant)
+    for tile_type in WORLD_TILE_TYPES:
+        yield 'create_world_map_tile', (tile_type,)
+
+
+def sprite_key(name, args):
+    """The sprite cache key a factory call resolves to."""
+    return (name,) + getattr(sprites, name).normalize(*args)
+
+
+class SpriteAtlas:
+    """One surface holding many sprites, plus the subrect of each."""
+
+    def __init__(self, surface, rects):
+        self.surface = surface
+        self.rects = rects  # sprite cache key -> pygame.Rect
+
+    @classmethod
+    def bake(cls, variants=None):
+        """
+        Shelf-pack the pixel spec of every variant and rasterize them all
+        into a new atlas in one pass.
+        """
+        specs = {}
+        for name, args in variants or sprite_variants():
+            key = sprite_key(name, args)
+            if key not in specs:
+                specs[key] = getattr(sprites, name).spec(*key[1:])
+    
+        # Pack at 1x: tallest first, left to right in rows ("shelves")
+        scale = settings.PIXEL_SCALE
+        order = sorted(specs, key=lambda k: -specs[k].height)
+        positions = {}
+        x = y = shelf_height = 0
+        for key in order:
+            w, h = specs[key].width, specs[key].height
+            if x + w > ATLAS_WIDTH // scale:
+                x = 0
+                y += shelf_height + ATLAS_PADDING
+                shelf_height = 0
+            positions[key] = (x, y)
+            x += w + ATLAS_PADDING
+            shelf_height = max(shelf_height, h)
+    
+        surface = sprites.rasterize_sheet([specs[key] for key in order],
+                                          [positions[key] for key in order],
+                                          (ATLAS_WIDTH // scale, y + shelf_height), scale)
+        rects = {key: pygame.Rect(positions[key][0] * scale, positions[key][1] * scale,
+                                  specs[key].width * scale, specs[key].height * scale)
+                 for key in order}
+        return cls(surface, rects)
+
+    def save(self, png_path, index_path):
+        """Write the atlas image and its index of subrects."""
+        pygame.image.save(self.surface, png_path)
+        index = [{'key': list(key), 'rect': list(rect)} for key, rect in self.rects.items()]
+        with open(index_path, 'w') as f:
+            json.dump(index, f)
+
+    @classmethod
+    def load(cls, png_path, index_path):
+        """Read an atlas written by save()."""
+        with open(index_path) as f:
+            index = json.load(f)
+        surface = pygame.image.load(png_path)
+        rects = {tuple(entry['key']): pygame.Rect(entry['rect']) for entry in index}
+        return cls(surface, rects)
+
+    def get(self, key):
+        """
+        Standalone display-format copy of the sprite for a cache key, cut
+        from the atlas (once the display exists).
+        """
+        return finalize_surface(self.surface.subsurface(self.rects[key]).copy())
+    
+    def install(self):
+        """Serve every packed sprite from the atlas via the sprite cache."""
+        for key in self.rects:
+            sprite_cache.pin(key, self.get(key))
+
+
+def cache_key():
+    """
+    Hash of everything the atlas pixels depend on: the sprite and atlas
+    code, the palette and the pixel scale.
+    """
+    digest = hashlib.sha256()
+    for path in (sprites.__file__, __file__):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    palette = sorted((name, value) for name, value in vars(settings).items()
+                     if name.isupper() and isinstance(value, tuple))
+    digest.update(repr((palette, settings.PIXEL_SCALE)).encode())
+    return digest.hexdigest()[:16]
+
+
+def load_or_bake(cache_dir=CACHE_DIR):
+    """
+    Load the atlas from the disk cache, or bake it and cache the result.
+
+    Returns (atlas, seconds taken, whether it came from the cache).
+    """
+    start = time.perf_counter()
+    key = cache_key()
+    png_path = os.path.join(cache_dir, f'atlas-{key}.png')
+    index_path = os.path.join(cache_dir, f'atlas-{key}.json')
+
+    try:
+        result = SpriteAtlas.load(png_path, index_path)
+        warm = True
+    except (OSError, ValueError, KeyError, TypeError, pygame.error):
+        result = SpriteAtlas.bake()
+        warm = False
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            result.save(png_path, index_path)
+        except (OSError, pygame.error):
+            pass  # Read-only install: bake again next time
+    return result, time.perf_counter() - start, warm
+
+
+atlas = None
+
+
+def bake_atlas():
+    """Build the game's sprite atlas (once) and route sprite lookups to it."""
+    if atlas is None:
+        use_atlas(*load_or_bake())
+    return atlas
+
+
+def use_atlas(baked, seconds, warm):
+    """
+    Make a load_or_bake() result the game's atlas. Converts surfaces to
+    the display format, so call it from the main thread.
+    """
+    global atlas
+    atlas = baked
+    atlas.install()
+    how = 'loaded from cache' if warm else 'baked'
+    print(f"🎨 Sprite atlas {how} in {seconds * 1000:.1f} ms "
+          f"({len(atlas.rects)} sprites)")
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    with tempfile.TemporaryDirectory() as cache_dir:
+        _, cold, _ = load_or_bake(cache_dir)
+        _, warm, from_cache = load_or_bake(cache_dir)
+    assert from_cache
+    print(f"cold start (bake + save): {cold * 1000:.1f} ms")
+    print(f"warm start (load):        {warm * 1000:.1f} ms")
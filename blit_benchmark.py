@@ -0,0 +1,57 @@
+"""
+Blit throughput benchmark for Chain's sprites
+
+Blits every atlas sprite onto an 800x600 display surface, first as the raw
+per-pixel-alpha surfaces sprites.py draws and then after the display-format
+finalization pass (colour key + RLE), and prints blits per second for each.
+
+Usage:
+    python blit_benchmark.py [rounds]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from settings import *
+import sprites
+from atlas import SpriteAtlas
+
+
+def blits_per_second(screen, images, rounds):
+    """Blit every image `rounds` times, spread over the screen."""
+    positions = [((i * 37) % (SCREEN_WIDTH - 48), (i * 53) % (SCREEN_HEIGHT - 48))
+                 for i in range(len(images))]
+    jobs = list(zip(images, positions))
+    blit = screen.blit
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for image, pos in jobs:
+            blit(image, pos)
+    return rounds * len(jobs) / (time.perf_counter() - start)
+
+
+def main(rounds=500):
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    baked = SpriteAtlas.bake()
+    raw = [baked.surface.subsurface(rect).copy() for rect in baked.rects.values()]
+    results = [('raw SRCALPHA sprites', raw)]
+    results.append(('finalized sprites', [sprites.finalize_surface(image) for image in raw]))
+    results.append(('installed atlas sprites', [baked.get(key) for key in baked.rects]))
+
+    print(f"{len(raw)} sprites x {rounds} rounds onto "
+          f"{SCREEN_WIDTH}x{SCREEN_HEIGHT} ({screen.get_bitsize()}-bit display)")
+    baseline = None
+    for label, images in results:
+        rate = blits_per_second(screen, images, rounds)
+        baseline = baseline or rate
+        print(f"  {label:28s} {rate:12,.0f} blits/s  ({rate / baseline:.2f}x)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -6,16 +6,20 @@ import pygame
 import math
 import random
 from settings import *
-from sprites import create_slime_sprite, create_bat_sprite, create_knight_sprite, create_cannon_sprite
+from sprites import get_sprite, solid_sprite
 from introspection import introspect
 
 
 class Enemy(pygame.sprite.Sprite):
     """Base enemy class"""
     
+    # Fields snapshotted for introspection metadata each time the enemy is drawn
+    INTROSPECT_FIELDS = (("type", "enemy_type"), "health", "max_health", "state", "damage")
+    
     def __init__(self, x, y, enemy_type):
         super().__init__()
         self.enemy_type = enemy_type
+        self.introspect_name = f"enemy_{enemy_type}"
         self.stats = ENEMY_TYPES[enemy_type]
         
         self.max_health = self.stats['health']
@@ -68,12 +72,16 @@ class Enemy(pygame.sprite.Sprite):
         pass
     
     def physics_update(self, tiles):
-        """Apply physics"""
+        """Apply physics (tiles is the level's TileMap)"""
         # Apply gravity
         self.velocity_y += PLAYER_GRAVITY
         if self.velocity_y > 15:
             self.velocity_y = 15
         
+        # Only tiles along this frame's move can collide
+        if tiles:
+            tiles = tiles.query(self.rect, self.velocity_x, self.velocity_y)
+        
         # Move
         self.rect.x += self.velocity_x
         self.rect.y += self.velocity_y
@@ -108,9 +116,8 @@ class Enemy(pygame.sprite.Sprite):
         if self.hurt_timer > 0 and self.frame % 4 < 2:
             return
         
-        introspect.draw(surface, self.image, (draw_x, draw_y), f"enemy_{self.enemy_type}",
-                       {"type": self.enemy_type, "health": self.health, "max_health": self.max_health,
-                        "state": self.state, "damage": self.damage})
+        introspect.draw(surface, self.image, (draw_x, draw_y), self.introspect_name,
+                       self.INTROSPECT_FIELDS, owner=self)
         
         # Draw health bar for tough enemies
         if self.max_health > 2:
@@ -140,7 +147,7 @@ class Slime(Enemy):
         self.hop_timer = 0
     
     def update_sprite(self):
-        self.image = create_slime_sprite(self.frame)
+        self.image = get_sprite('slime', 'hop', frame=self.frame)
     
     def ai_update(self, player):
         self.velocity_x = 0
@@ -176,7 +183,7 @@ class Bat(Enemy):
         self.swoop_target = None
     
     def update_sprite(self):
-        self.image = create_bat_sprite(self.frame)
+        self.image = get_sprite('bat', 'fly', frame=self.frame)
     
     def ai_update(self, player):
         # Erratic flying pattern
@@ -220,7 +227,7 @@ class Knight(Enemy):
         self.charging = False
     
     def update_sprite(self):
-        self.image = create_knight_sprite(self.facing_right, self.frame)
+        self.image = get_sprite('knight', 'walk', self.facing_right, self.frame)
     
     def ai_update(self, player):
         self.velocity_x = 0
@@ -294,10 +301,9 @@ class Cannon(Enemy):
     def update_sprite(self):
         # Flash during phase transition (guard against early call during __init__)
         if getattr(self, 'phase_transition', False) and self.frame % 4 < 2:
-            self.image = pygame.Surface((48, 48), pygame.SRCALPHA)
-            self.image.fill((*YELLOW[:3], 200))
+            self.image = solid_sprite((48, 48), (*YELLOW[:3], 200))
         else:
-            self.image = create_cannon_sprite(self.frame)
+            self.image = get_sprite('cannon', 'idle', frame=self.frame)
     
     def ai_update(self, player):
         self.velocity_x = 0
@@ -445,9 +451,9 @@ class Cannon(Enemy):
         
         # Track the boss health bar region for introspection
         introspect.track_region(
-            pygame.Rect(SCREEN_WIDTH // 2 - 260, 45, 520, 80),
+            (SCREEN_WIDTH // 2 - 260, 45, 520, 80),
             "boss_health_bar",
-            {"phase": self.phase, "health": self.health, "max_health": self.max_health}
+            ("phase", "health", "max_health"), owner=self
         )
     
     def draw_boss_health_bar(self, surface):
@@ -590,7 +596,7 @@ class CannonBall(pygame.sprite.Sprite):
         draw_x = self.rect.x - camera_offset[0]
         draw_y = self.rect.y - camera_offset[1]
         introspect.draw(surface, self.image, (draw_x, draw_y), "cannon_ball",
-                       {"damage": self.damage, "lifetime": self.lifetime})
+                       ("damage", "lifetime"), owner=self)
 
 
 def create_enemy(enemy_type, x, y):
@@ -10,6 +10,7 @@ from level import Level
 from ui import UI
 from sounds import get_sound_manager
 from introspection import introspect
+from loader import AssetLoader
 
 
 class Game:
@@ -41,13 +42,18 @@ class Game:
         self.ui = UI()
         
         # Sound
-        self.sound = get_sound_manager()
+        self.sound = get_sound_manager(generate=False)
+        
+        # Bake the sprite atlas and generate sounds while the menu is up
+        self.loader = AssetLoader(self.sound)
+        self.loader.start()
         
         # Events from last frame
         self.events = []
     
     def new_game(self):
         """Start a new game"""
+        self.loader.finish()
         self.world_map = WorldMap()
         start_pos = self.world_map.get_start_position()
         
@@ -160,6 +166,9 @@ class Game:
     
     def update(self):
         """Update game state"""
+        if not self.loader.done:
+            self.loader.poll()
+        
         if self.state == STATE_WORLD_MAP:
             self.update_world_map()
         elif self.state == STATE_LEVEL:
@@ -189,9 +198,8 @@ class Game:
         keys = pygame.key.get_pressed()
         self.player.handle_input(keys, self.events)
         
-        # Get tiles for collision
-        tiles = self.current_level.get_tiles()
-        self.player.update(tiles)
+        # Collide against the level's tilemap
+        self.player.update(self.current_level.tilemap)
         
         # Update level
         self.current_level.update(self.player)
@@ -318,13 +326,14 @@ class Game:
         
         # Draw introspection overlay (shows element boundaries when enabled)
         introspect.draw_overlay(self.screen)
+        introspect.end_frame()
         
         pygame.display.flip()
     
     def draw_menu(self):
         """Draw main menu"""
-        # Start menu music if not playing
-        if self.sound.current_music != 'menu':
+        # Start menu music if not playing (once its track has loaded)
+        if self.sound.current_music != 'menu' and 'menu' in self.sound.music:
             self.sound.play_music('menu')
         
         # Draw title
@@ -347,6 +356,9 @@ class Game:
             # Draw menu options
             self.ui.draw_menu(self.screen, "", self.menu_options, self.menu_selection)
         
+        if not self.loader.done:
+            self.ui.draw_loading(self.screen, self.loader.progress)
+        
         # Draw decorative chain character
         from sprites import create_chain_sprite
         chain_sprite = create_chain_sprite(True, pygame.time.get_ticks() // 100)
@@ -426,4 +438,6 @@ class Game:
             self.draw()
             self.clock.tick(FPS)
         
+        introspect.stop_trace()  # Finish any trace still being recorded
+        self.loader.close()  # Quitting from the menu: stop loading assets
         pygame.quit()
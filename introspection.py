@@ -10,27 +10,110 @@ Usage:
     # Wrap any draw call to track it:
     introspect.draw(surface, image, rect, "element_name")
     
+    # Metadata can be deferred: a tuple of field names is snapshotted from
+    # owner, a callable is only evaluated when the element is inspected
+    introspect.draw(surface, image, rect, "enemy", ("health", "state"), owner=self)
+    
+    # A (key, attribute path) pair shows a field under its own key
+    introspect.draw(surface, image, rect, "item", (("world_x", "rect.x"),), owner=self)
+    
+    # Pre-rendered layers (e.g. terrain chunks) resolve clicks themselves:
+    # hit_test(x, y) gets layer-relative coordinates and returns
+    # (name, layer-relative rect, metadata) for the piece under the point;
+    # pieces lists the layer-relative rects actually drawn on, for coverage
+    introspect.draw_layer(surface, chunk, pos, "terrain", hit_test, pieces)
+    
     # Or use the decorator on draw methods:
     @introspect.track
     def draw(self, surface, camera_offset):
         ...
     
     # In the game loop:
-    introspect.begin_frame()  # Clear previous frame's data
+    introspect.begin_frame()  # Start recording a new frame
     # ... all draw calls ...
-    introspect.handle_click(event)  # Check for Cmd+click
+    introspect.end_frame()  # Answer any Cmd+click waiting on this frame
+    introspect.handle_event(event)  # Check for Cmd+click
+    
+    # Record frames to a binary trace for offline analysis
+    introspect.start_trace("session.chaintrace")
+    introspect.stop_trace()
 """
 
-import inspect
 import os
 import sys
 import webbrowser
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Dict, Any
+from operator import attrgetter
+from typing import List, Optional, Tuple, Dict, Any, Callable, NamedTuple
 import pygame
 
+try:
+    import numpy as np
+except ImportError:  # The overdraw heatmap falls back to plain arrays
+    np = None
+
+from introspection_trace import TraceWriter
+
+
+# Capture tiers, from cheapest to most detailed
+CAPTURE_OFF = 'off'      # plain blits, no bookkeeping at all
+CAPTURE_RECTS = 'rects'  # geometry and names only
+CAPTURE_FULL = 'full'    # geometry, names, source stacks and metadata
+CAPTURE_MODES = (CAPTURE_OFF, CAPTURE_RECTS, CAPTURE_FULL)
+
+# Colour treated as transparent on the overlay's boundary layer
+_LAYER_COLORKEY = (255, 0, 255)
+
+# Overlay modes: element outlines, or per-cell overdraw counts
+OVERLAY_BOUNDARIES = 'boundaries'
+OVERLAY_HEATMAP = 'heatmap'
+
+# Overdraw heatmap: cell size in pixels and colour per coverage count
+# (index 0 is transparent, the last colour stands for "this many or more")
+HEATMAP_CELL = 8
+HEATMAP_COLORS = (
+    (0, 0, 0),
+    (0, 40, 160),
+    (0, 160, 60),
+    (220, 220, 0),
+    (255, 140, 0),
+    (255, 0, 0),
+)
+
+# Element metadata as passed to draw/track_region: a dict, a zero-argument
+# callable evaluated on inspection, or a tuple of fields read from the
+# ``owner`` object at draw time. A field is an attribute name, used as its
+# key, or a (key, attribute path) pair.
+MetadataSpec = Any
 
-@dataclass
+# Answer to a layer hit test: (name, layer-relative rect, metadata), or None
+LayerHit = Optional[Tuple[str, pygame.Rect, MetadataSpec]]
+
+
+class _Layer:
+    """Stored as a layer element's metadata: resolves points to pieces."""
+    __slots__ = ('hit_test', 'x', 'y')
+    
+    def __init__(self, hit_test: Callable[[int, int], LayerHit], x: int, y: int):
+        self.hit_test = hit_test
+        self.x = x  # Screen position of the layer (its elements may be pieces)
+        self.y = y
+
+
+# A call-site key: the chain of project frames that led to a tracked draw,
+# flattened as (code, lasti, code, lasti, ...), innermost first.
+CallSiteKey = Tuple[Any, ...]
+
+
+class CallSiteCacheInfo(NamedTuple):
+    """Hit/miss counters for the call-site cache."""
+    hits: int
+    misses: int
+    currsize: int
+
+
+@dataclass(frozen=True)
 class SourceLocation:
     """Represents a location in source code."""
     filepath: str
@@ -55,34 +138,228 @@ class DrawnElement:
     """Represents an element that was drawn to the screen."""
     name: str
     rect: pygame.Rect
-    source_stack: List[SourceLocation]
+    callsite_id: int = -1
     z_index: int = 0  # Higher = drawn later (on top)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    raw_metadata: MetadataSpec = field(default=None, repr=False)
+    resolver: Optional[Callable[[int], Tuple[SourceLocation, ...]]] = field(
+        default=None, repr=False, compare=False)
+    _metadata: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Metadata for this element, evaluated the first time it is read."""
+        if self._metadata is None:
+            self._metadata = _evaluate_metadata(self.raw_metadata)
+        return self._metadata
+    
+    @property
+    def source_stack(self) -> Tuple[SourceLocation, ...]:
+        """Source locations for this element, shared by its call site."""
+        if self.resolver is None or self.callsite_id < 0:
+            return ()
+        return self.resolver(self.callsite_id)
     
     def contains_point(self, x: int, y: int) -> bool:
         """Check if a point is within this element's bounds."""
         return self.rect.collidepoint(x, y)
 
 
+class FrameStore:
+    """
+    Compact struct-of-arrays storage for one frame's tracked elements.
+    
+    Each column is a preallocated array; clearing the store only resets
+    the length counters, so tracking a blit allocates nothing. The store
+    also keeps a screen-cell index as per-cell linked lists (newest entry
+    first), so walking a cell visits elements top first.
+    """
+    
+    def __init__(self, capacity: int = 512):
+        self.number = -1  # Frame counter value this store was filled on
+        self.mode = CAPTURE_OFF  # Capture tier used for this frame
+        self.length = 0
+        self.capacity = 0
+        self.x = array('i')
+        self.y = array('i')
+        self.w = array('i')
+        self.h = array('i')
+        self.z = array('i')
+        self.name_id = array('i')
+        self.callsite_id = array('i')
+        self.metadata: List[Any] = []
+        self._grow(capacity)
+        
+        # Spatial index
+        self.cell_size = 64
+        self.cols = 0
+        self.rows = 0
+        self.cell_head = array('i')
+        self._blank_heads = array('i')
+        self.entry_count = 0
+        self.entry_capacity = 0
+        self.entry_element = array('i')
+        self.entry_next = array('i')
+        self._grow_entries(capacity * 2)
+    
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self.capacity
+        zeros = array('i', bytes(4 * extra))
+        for column in (self.x, self.y, self.w, self.h, self.z,
+                       self.name_id, self.callsite_id):
+            column.extend(zeros)
+        self.metadata.extend([None] * extra)
+        self.capacity = capacity
+    
+    def _grow_entries(self, capacity: int) -> None:
+        zeros = array('i', bytes(4 * (capacity - self.entry_capacity)))
+        self.entry_element.extend(zeros)
+        self.entry_next.extend(zeros)
+        self.entry_capacity = capacity
+    
+    def reset(self, width: int, height: int, cell_size: int) -> None:
+        """Empty the store for a new frame covering a width x height screen."""
+        self.length = 0
+        self.entry_count = 0
+        
+        cols = max(1, (width + cell_size - 1) // cell_size)
+        rows = max(1, (height + cell_size - 1) // cell_size)
+        if (cols, rows, cell_size) != (self.cols, self.rows, self.cell_size):
+            self.cols = cols
+            self.rows = rows
+            self.cell_size = cell_size
+            self._blank_heads = array('i', [-1]) * (cols * rows)
+            self.cell_head = array('i', self._blank_heads)
+        else:
+            self.cell_head[:] = self._blank_heads
+    
+    def append(self, x: int, y: int, w: int, h: int, z: int,
+               name_id: int, callsite_id: int, metadata: Any) -> int:
+        """Record an element and index it in every cell it overlaps."""
+        i = self.length
+        if i == self.capacity:
+            self._grow(self.capacity * 2)
+        
+        self.x[i] = x
+        self.y[i] = y
+        self.w[i] = w
+        self.h[i] = h
+        self.z[i] = z
+        self.name_id[i] = name_id
+        self.callsite_id[i] = callsite_id
+        self.metadata[i] = metadata
+        self.length = i + 1
+        
+        if w <= 0 or h <= 0:
+            return i
+        
+        cs = self.cell_size
+        x0 = max(0, x // cs)
+        y0 = max(0, y // cs)
+        x1 = min(self.cols - 1, (x + w - 1) // cs)
+        y1 = min(self.rows - 1, (y + h - 1) // cs)
+        
+        cols = self.cols
+        head = self.cell_head
+        for cy in range(y0, y1 + 1):
+            row = cy * cols
+            for cx in range(x0, x1 + 1):
+                e = self.entry_count
+                if e == self.entry_capacity:
+                    self._grow_entries(self.entry_capacity * 2)
+                cell = row + cx
+                self.entry_element[e] = i
+                self.entry_next[e] = head[cell]
+                head[cell] = e
+                self.entry_count = e + 1
+        
+        return i
+    
+    def indices_at(self, x: int, y: int) -> List[int]:
+        """Indices of the elements containing a point, top first."""
+        cs = self.cell_size
+        cx = x // cs
+        cy = y // cs
+        if x < 0 or y < 0 or cx >= self.cols or cy >= self.rows:
+            return []
+        
+        xs, ys, ws, hs = self.x, self.y, self.w, self.h
+        element, next_entry = self.entry_element, self.entry_next
+        result = []
+        e = self.cell_head[cy * self.cols + cx]
+        while e >= 0:
+            i = element[e]
+            if xs[i] <= x < xs[i] + ws[i] and ys[i] <= y < ys[i] + hs[i]:
+                result.append(i)
+            e = next_entry[e]
+        return result
+
+
 class IntrospectionSystem:
     """
     Tracks all rendered elements and enables Cmd+click inspection.
     """
     
-    def __init__(self):
-        self.elements: List[DrawnElement] = []
+    def __init__(self, history_size: int = 4):
+        # Ring buffer of recent frames; self.frame is the one being drawn
+        # (or, between frames, the last one completed)
+        self.history = [FrameStore() for _ in range(max(1, history_size))]
+        self.frame_number = 0
+        self.frame = self.history[0]
         self.z_counter = 0
-        self.enabled = True
         self.project_root = os.path.dirname(os.path.abspath(__file__))
         
+        # Capture tier: 'rects' is upgraded to 'full' while the overlay is
+        # visible or Cmd is held, so a Cmd+click always has stacks to show
+        self.capture_mode = CAPTURE_RECTS
+        self.frame_mode = self.capture_mode
+        self._enabled_mode = CAPTURE_RECTS
+        
         # Visual feedback
         self.show_overlay = False
+        self.overlay_mode = OVERLAY_BOUNDARIES
         self.hovered_elements: List[DrawnElement] = []
         self.last_click_elements: List[DrawnElement] = []
         
+        # Binary trace being recorded (see introspection_trace)
+        self._trace: Optional[TraceWriter] = None
+        
+        # Cmd+click waiting for a replayed 'full' frame: (x, y, frame number)
+        self._pending_click: Optional[Tuple[int, int, int]] = None
+        
+        # Filename -> "is part of our project" cache for stack capture
+        self._project_files: Dict[str, bool] = {}
+        
+        # Interned call sites: key -> id, id -> key / resolved stack
+        self._callsite_ids: Dict[CallSiteKey, int] = {}
+        self._callsite_keys: List[CallSiteKey] = []
+        self._callsite_stacks: List[Optional[Tuple[SourceLocation, ...]]] = []
+        self.callsite_hits = 0
+        self.callsite_misses = 0
+        
+        # Field tuple -> (keys, attrgetter), for snapshotting metadata
+        self._field_getters: Dict[Tuple[Any, ...], Tuple[Tuple[str, ...], attrgetter]] = {}
+        
+        # Interned element names (the frame store keeps ids)
+        self._name_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        
+        # Spatial index cell size in pixels
+        self.cell_size = 64
+        
         # Fonts for overlay (lazy init)
         self._overlay_font = None
         self._overlay_font_small = None
+        
+        # Overlay caches: boundary layer keyed by frame geometry, info
+        # panel keyed by the hovered elements it describes
+        self._boundary_layer: Optional[pygame.Surface] = None
+        self._boundary_key: Optional[Tuple[Any, ...]] = None
+        self._heatmap_layer: Optional[pygame.Surface] = None
+        self._heatmap_key: Optional[Tuple[Any, ...]] = None
+        self._heatmap_stats = (0, 0.0)  # (max, mean over covered cells)
+        self._panel_surface: Optional[pygame.Surface] = None
+        self._panel_key: Optional[Tuple[Any, ...]] = None
     
     @property
     def overlay_font(self):
@@ -98,49 +375,239 @@ class IntrospectionSystem:
             self._overlay_font_small = pygame.font.Font(None, 18)
         return self._overlay_font_small
     
+    @property
+    def enabled(self) -> bool:
+        """Whether any tracking happens (capture mode is not 'off')."""
+        return self.capture_mode != CAPTURE_OFF
+    
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        if value:
+            self.set_capture_mode(self._enabled_mode)
+        else:
+            self.set_capture_mode(CAPTURE_OFF)
+    
+    def set_capture_mode(self, mode: str) -> None:
+        """
+        Switch the capture tier: 'off', 'rects' or 'full'.
+        
+        Takes effect from the next begin_frame.
+        """
+        if mode not in CAPTURE_MODES:
+            raise ValueError(f"Unknown capture mode {mode!r}, expected one of {CAPTURE_MODES}")
+        self.capture_mode = mode
+        if mode != CAPTURE_OFF:
+            self._enabled_mode = mode
+    
     def begin_frame(self):
-        """Clear tracking data for a new frame."""
-        self.elements.clear()
+        """Start a new frame, reusing the oldest store in the history ring."""
+        mode = self.capture_mode
+        if mode == CAPTURE_RECTS:
+            if self._pending_click is not None:
+                mode = CAPTURE_FULL  # Replay this frame for a Cmd+click
+            elif pygame.display.get_init() and (
+                    self.show_overlay or pygame.key.get_mods() & pygame.KMOD_META):
+                mode = CAPTURE_FULL
+        self.frame_mode = mode
+        
+        self.frame_number += 1
+        self.frame = self.history[self.frame_number % len(self.history)]
+        
+        display = pygame.display.get_surface()
+        width, height = display.get_size() if display else (4096, 4096)
+        self.frame.reset(width, height, self.cell_size)
+        self.frame.number = self.frame_number
+        self.frame.mode = mode
         self.z_counter = 0
     
-    def _get_source_stack(self, skip_frames: int = 2) -> List[SourceLocation]:
+    def end_frame(self) -> None:
+        """
+        Finish the current frame.
+        
+        If a Cmd+click arrived while only geometry was being recorded, this
+        frame was replayed in 'full' mode and the click is answered now.
         """
-        Get the call stack with source locations.
+        if self._trace is not None and self.frame.mode != CAPTURE_OFF:
+            self._trace.write_frame(self.frame)
+        
+        if self._pending_click is None or self.frame.mode != CAPTURE_FULL:
+            return
+        
+        x, y, clicked_number = self._pending_click
+        self._pending_click = None
+        
+        elements = self.get_elements_at(x, y)
+        if not elements:
+            # Nothing here any more: fall back to what was on screen
+            elements = self.get_elements_at(x, y, self.frame_number - clicked_number)
+        if elements:
+            self.last_click_elements = elements
+            self._open_in_cursor(elements)
+    
+    @property
+    def tracing(self) -> bool:
+        return self._trace is not None
+    
+    def start_trace(self, path: str) -> None:
+        """Start streaming every captured frame to a binary trace file."""
+        self.stop_trace()
+        self._trace = TraceWriter(path)
+    
+    def stop_trace(self) -> Optional[str]:
+        """Finish the trace file (string tables and index); returns its path."""
+        trace, self._trace = self._trace, None
+        if trace is None:
+            return None
+        callsites = [" < ".join(str(loc) for loc in self._resolve_stack(i)) or "<unknown>"
+                     for i in range(len(self._callsite_keys))]
+        trace.close(self._names, callsites)
+        return trace.path
+    
+    def get_frame(self, frames_ago: int = 0) -> Optional[FrameStore]:
+        """Get a recent frame from the history ring (0 = current)."""
+        if not 0 <= frames_ago < len(self.history):
+            return None
+        frame = self.history[(self.frame_number - frames_ago) % len(self.history)]
+        if frame.number != self.frame_number - frames_ago:
+            return None
+        return frame
+    
+    @property
+    def elements(self) -> List[DrawnElement]:
+        """All elements tracked this frame (materialized on access)."""
+        return [self._element(self.frame, i) for i in range(self.frame.length)]
+    
+    def _element(self, frame: FrameStore, i: int) -> DrawnElement:
+        """Build a DrawnElement view of row i of a frame store."""
+        return DrawnElement(
+            name=self._names[frame.name_id[i]],
+            rect=pygame.Rect(frame.x[i], frame.y[i], frame.w[i], frame.h[i]),
+            callsite_id=frame.callsite_id[i],
+            resolver=self._resolve_stack,
+            z_index=frame.z[i],
+            raw_metadata=frame.metadata[i]
+        )
+    
+    def _name_id(self, name: str) -> int:
+        """Interned id of an element name."""
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._name_ids[name] = name_id
+            self._names.append(name)
+        return name_id
+    
+    def _track(self, name: str, x: int, y: int, w: int, h: int,
+               metadata: MetadataSpec, owner: Any, skip_frames: int) -> None:
+        """Record an element in the current frame store."""
+        name_id = self._name_id(name)
+        
+        if self.frame_mode != CAPTURE_FULL:
+            self.frame.append(int(x), int(y), w, h, self.z_counter,
+                              name_id, -1, None)
+            self.z_counter += 1
+            return
+        
+        if type(metadata) is tuple:
+            # Snapshot just the values now; the dict is built on inspection
+            fields = self._field_getters.get(metadata)
+            if fields is None:
+                keys = tuple(f if type(f) is str else f[0] for f in metadata)
+                getter = attrgetter(*(f if type(f) is str else f[1] for f in metadata))
+                fields = self._field_getters[metadata] = (keys, getter)
+            keys, getter = fields
+            values = getter(owner)
+            metadata = (keys, values if len(keys) > 1 else (values,))
+        
+        callsite_id = self._capture_stack(skip_frames + 1)
+        self.frame.append(int(x), int(y), w, h, self.z_counter,
+                          name_id, callsite_id, metadata)
+        self.z_counter += 1
+    
+    def _capture_stack(self, skip_frames: int = 2) -> int:
+        """
+        Capture the call stack and return its interned call-site id.
+        
+        Only (code, lasti) pairs are read from the frames, so repeated draws
+        from the same call path cost one dict lookup. Line numbers and
+        SourceLocations are worked out later, once per call site.
         
         Args:
             skip_frames: Number of frames to skip (internal calls)
         """
-        stack = []
+        try:
+            frame = sys._getframe(skip_frames)
+        except ValueError:
+            return -1
         
-        for frame_info in inspect.stack()[skip_frames:]:
-            filepath = frame_info.filename
+        project_files = self._project_files
+        key = []
+        while frame is not None:
+            code = frame.f_code
+            filename = code.co_filename
             
             # Only include frames from our project
-            if not self._is_project_file(filepath):
-                continue
+            is_project = project_files.get(filename)
+            if is_project is None:
+                is_project = self._is_project_file(filename)
+                project_files[filename] = is_project
             
+            if is_project:
+                key.append(code)
+                key.append(frame.f_lasti)
+            frame = frame.f_back
+        
+        key = tuple(key)
+        callsite_id = self._callsite_ids.get(key)
+        if callsite_id is not None:
+            self.callsite_hits += 1
+            return callsite_id
+        
+        self.callsite_misses += 1
+        callsite_id = len(self._callsite_keys)
+        self._callsite_ids[key] = callsite_id
+        self._callsite_keys.append(key)
+        self._callsite_stacks.append(None)
+        return callsite_id
+    
+    def _resolve_stack(self, callsite_id: int) -> Tuple[SourceLocation, ...]:
+        """Get the (shared, immutable) source stack for a call site."""
+        stack = self._callsite_stacks[callsite_id]
+        if stack is not None:
+            return stack
+        
+        key = self._callsite_keys[callsite_id]
+        locations = []
+        for code, lasti in zip(key[::2], key[1::2]):
             # Get relative path for cleaner display
             try:
-                rel_path = os.path.relpath(filepath, self.project_root)
+                rel_path = os.path.relpath(code.co_filename, self.project_root)
             except ValueError:
-                rel_path = filepath
+                rel_path = code.co_filename
             
-            # Try to get class name if in a method
+            # Class name comes from the qualified name (e.g. "Player.draw")
             class_name = None
-            if 'self' in frame_info.frame.f_locals:
-                class_name = type(frame_info.frame.f_locals['self']).__name__
-            elif 'cls' in frame_info.frame.f_locals:
-                class_name = frame_info.frame.f_locals['cls'].__name__
+            qualname = getattr(code, 'co_qualname', code.co_name)
+            parts = qualname.split('.')
+            if len(parts) > 1 and parts[-2] != '<locals>':
+                class_name = parts[-2]
             
-            stack.append(SourceLocation(
+            locations.append(SourceLocation(
                 filepath=rel_path,
-                line=frame_info.lineno,
-                function=frame_info.function,
+                line=_line_for_offset(code, lasti),
+                function=code.co_name,
                 class_name=class_name
             ))
         
+        stack = tuple(locations)
+        self._callsite_stacks[callsite_id] = stack
         return stack
     
+    def callsite_cache_info(self) -> CallSiteCacheInfo:
+        """Report call-site cache hits, misses and size."""
+        return CallSiteCacheInfo(self.callsite_hits, self.callsite_misses,
+                                 len(self._callsite_keys))
+    
     def _is_project_file(self, filepath: str) -> bool:
         """Check if a file is part of our project."""
         try:
@@ -154,8 +621,9 @@ class IntrospectionSystem:
              image: pygame.Surface, 
              pos: Tuple[int, int],
              name: str = "unknown",
-             metadata: Dict[str, Any] = None,
-             skip_frames: int = 2) -> None:
+             metadata: MetadataSpec = None,
+             skip_frames: int = 2,
+             owner: Any = None) -> None:
         """
         Draw an image and track it for introspection.
         
@@ -164,27 +632,67 @@ class IntrospectionSystem:
             image: The image/surface to draw
             pos: (x, y) position to draw at
             name: Human-readable name for this element
-            metadata: Additional data to associate with this element
+            metadata: Additional data to associate with this element: a dict,
+                a callable evaluated only when the element is inspected, or a
+                tuple of fields (attribute names, or (key, attribute path)
+                pairs) whose values are snapshotted from ``owner`` now and
+                turned into a dict on inspection
             skip_frames: Stack frames to skip when getting source
+            owner: Object to read tuple-of-field-names metadata from
         """
         # Perform the actual draw
         surface.blit(image, pos)
         
-        if not self.enabled:
+        if self.frame_mode == CAPTURE_OFF:
             return
         
         # Track the element
-        rect = pygame.Rect(pos[0], pos[1], image.get_width(), image.get_height())
-        source_stack = self._get_source_stack(skip_frames + 1)
-        
-        self.elements.append(DrawnElement(
-            name=name,
-            rect=rect,
-            source_stack=source_stack,
-            z_index=self.z_counter,
-            metadata=metadata or {}
-        ))
-        self.z_counter += 1
+        w, h = image.get_size()
+        self._track(name, pos[0], pos[1], w, h, metadata, owner, skip_frames + 1)
+    
+    def draw_layer(self,
+                   surface: pygame.Surface,
+                   image: pygame.Surface,
+                   pos: Tuple[int, int],
+                   name: str,
+                   hit_test: Callable[[int, int], LayerHit],
+                   pieces: Optional[List[Tuple[int, int, int, int]]] = None,
+                   skip_frames: int = 2) -> None:
+        """
+        Draw a pre-rendered layer made of many pieces.
+        
+        Lookups resolve to individual pieces via hit_test(x, y), called with
+        coordinates relative to the layer's top-left corner; it returns
+        (name, rect relative to the layer, metadata) or None where there is
+        nothing to inspect.
+        
+        pieces lists the (x, y, w, h) rects, relative to the layer, that
+        hold something. Each is tracked as an element of its own, so the
+        overdraw heatmap and traces count only what was actually drawn.
+        Without it the whole layer is tracked as one element.
+        """
+        surface.blit(image, pos)
+        
+        if self.frame_mode == CAPTURE_OFF:
+            return
+        
+        if pieces is None:
+            w, h = image.get_size()
+            self._track(name, pos[0], pos[1], w, h, _Layer(hit_test, int(pos[0]), int(pos[1])),
+                        None, skip_frames + 1)
+            return
+        
+        name_id = self._name_id(name)
+        x, y = int(pos[0]), int(pos[1])
+        callsite_id = -1
+        layer = None
+        if self.frame_mode == CAPTURE_FULL:
+            callsite_id = self._capture_stack(skip_frames + 1)
+            layer = _Layer(hit_test, x, y)
+        append = self.frame.append
+        for piece_x, piece_y, w, h in pieces:
+            append(x + piece_x, y + piece_y, w, h, self.z_counter, name_id, callsite_id, layer)
+            self.z_counter += 1
     
     def draw_rect(self,
                   surface: pygame.Surface,
@@ -192,56 +700,62 @@ class IntrospectionSystem:
                   rect: pygame.Rect,
                   width: int = 0,
                   name: str = "rect",
-                  metadata: Dict[str, Any] = None,
-                  skip_frames: int = 2) -> None:
+                  metadata: MetadataSpec = None,
+                  skip_frames: int = 2,
+                  owner: Any = None) -> None:
         """
         Draw a rectangle and track it for introspection.
         """
         pygame.draw.rect(surface, color, rect, width)
         
-        if not self.enabled:
+        if self.frame_mode == CAPTURE_OFF:
             return
         
-        source_stack = self._get_source_stack(skip_frames + 1)
-        
-        self.elements.append(DrawnElement(
-            name=name,
-            rect=pygame.Rect(rect),  # Copy the rect
-            source_stack=source_stack,
-            z_index=self.z_counter,
-            metadata=metadata or {}
-        ))
-        self.z_counter += 1
+        x, y, w, h = rect
+        self._track(name, x, y, w, h, metadata, owner, skip_frames + 1)
     
     def track_region(self,
                      rect: pygame.Rect,
                      name: str,
-                     metadata: Dict[str, Any] = None,
-                     skip_frames: int = 2) -> None:
+                     metadata: MetadataSpec = None,
+                     skip_frames: int = 2,
+                     owner: Any = None) -> None:
         """
         Track a screen region without drawing anything.
         Useful for tracking logical areas like "HUD region" or "game area".
         """
-        if not self.enabled:
+        if self.frame_mode == CAPTURE_OFF:
             return
         
-        source_stack = self._get_source_stack(skip_frames + 1)
-        
-        self.elements.append(DrawnElement(
-            name=name,
-            rect=pygame.Rect(rect),
-            source_stack=source_stack,
-            z_index=self.z_counter,
-            metadata=metadata or {}
-        ))
-        self.z_counter += 1
+        x, y, w, h = rect
+        self._track(name, x, y, w, h, metadata, owner, skip_frames + 1)
     
-    def get_elements_at(self, x: int, y: int) -> List[DrawnElement]:
+    def get_elements_at(self, x: int, y: int, frames_ago: int = 0) -> List[DrawnElement]:
         """
         Get all elements at a screen position, sorted by z-index (top first).
+        
+        frames_ago looks the point up in an earlier frame from the history.
+        
+        Only the elements indexed in the point's grid cell are tested, and
+        cells are walked newest first, so the result needs no sort.
+        DrawnElement views are only built for the elements that match.
         """
-        elements = [e for e in self.elements if e.contains_point(x, y)]
-        return sorted(elements, key=lambda e: e.z_index, reverse=True)
+        frame = self.get_frame(frames_ago)
+        if frame is None:
+            return []
+        elements = []
+        for i in frame.indices_at(x, y):
+            element = self._element(frame, i)
+            layer = frame.metadata[i]
+            if type(layer) is _Layer:
+                # Stand in the piece of the layer under the point
+                hit = layer.hit_test(x - layer.x, y - layer.y)
+                if hit is None:
+                    continue
+                element.name, rect, element.raw_metadata = hit
+                element.rect = rect.move(layer.x, layer.y)
+            elements.append(element)
+        return elements
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -258,18 +772,50 @@ class IntrospectionSystem:
             if event.key == pygame.K_i and (mods & pygame.KMOD_META) and (mods & pygame.KMOD_SHIFT):
                 self.show_overlay = not self.show_overlay
                 return True
+            
+            # Show the overdraw heatmap with Cmd+Shift+H
+            if event.key == pygame.K_h and (mods & pygame.KMOD_META) and (mods & pygame.KMOD_SHIFT):
+                if self.show_overlay and self.overlay_mode == OVERLAY_HEATMAP:
+                    self.overlay_mode = OVERLAY_BOUNDARIES
+                else:
+                    self.overlay_mode = OVERLAY_HEATMAP
+                    self.show_overlay = True
+                return True
+            
+            # Switch between 'rects' and 'full' capture with Cmd+Shift+M
+            if event.key == pygame.K_m and (mods & pygame.KMOD_META) and (mods & pygame.KMOD_SHIFT):
+                if self.capture_mode == CAPTURE_FULL:
+                    self.set_capture_mode(CAPTURE_RECTS)
+                else:
+                    self.set_capture_mode(CAPTURE_FULL)
+                print(f"🔍 Introspection capture mode: {self.capture_mode}")
+                return True
+            
+            # Start/stop recording a trace with Cmd+Shift+T
+            if event.key == pygame.K_t and (mods & pygame.KMOD_META) and (mods & pygame.KMOD_SHIFT):
+                if self.tracing:
+                    print(f"🔍 Trace written to {self.stop_trace()}")
+                else:
+                    self.start_trace(os.path.join(self.project_root, "introspection.chaintrace"))
+                    print("🔍 Recording introspection trace...")
+                return True
         
         # Handle Cmd+click
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mods = pygame.key.get_mods()
             if mods & pygame.KMOD_META:  # Cmd key on macOS
                 x, y = event.pos
-                elements = self.get_elements_at(x, y)
+                if not self.frame.indices_at(x, y):
+                    return False
                 
-                if elements:
+                if self.frame.mode == CAPTURE_FULL:
+                    elements = self.get_elements_at(x, y)
                     self.last_click_elements = elements
                     self._open_in_cursor(elements)
-                    return True
+                else:
+                    # Only geometry was kept: replay the next frame in full
+                    self._pending_click = (x, y, self.frame_number)
+                return True
         
         # Track mouse position for hover overlay
         if event.type == pygame.MOUSEMOTION and self.show_overlay:
@@ -330,10 +876,13 @@ class IntrospectionSystem:
         
         mouse_pos = pygame.mouse.get_pos()
         
-        # Draw all element boundaries (faintly)
-        for elem in self.elements:
-            color = (100, 100, 100, 50)
-            pygame.draw.rect(surface, color[:3], elem.rect, 1)
+        if self.overlay_mode == OVERLAY_HEATMAP:
+            # Show how many tracked elements cover each cell
+            surface.blit(self._heatmap_layer_for(surface), (0, 0))
+            self._draw_heatmap_legend(surface)
+        else:
+            # Draw all element boundaries (faintly), from a cached layer
+            surface.blit(self._boundary_layer_for(surface), (0, 0))
         
         # Highlight hovered elements
         for i, elem in enumerate(self.hovered_elements):
@@ -360,25 +909,133 @@ class IntrospectionSystem:
         if self.hovered_elements:
             self._draw_info_panel(surface, mouse_pos)
     
+    def _boundary_layer_for(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Return a transparent layer with every element boundary of the
+        current frame drawn on it. The layer is only redrawn when the
+        frame's geometry differs from the last one drawn.
+        """
+        frame = self.frame
+        n = frame.length
+        key = self._geometry_key(surface)
+        layer = self._boundary_layer
+        if layer is not None and key == self._boundary_key:
+            return layer
+        
+        if layer is None or layer.get_size() != surface.get_size():
+            layer = pygame.Surface(surface.get_size())
+            layer.set_colorkey(_LAYER_COLORKEY)
+            self._boundary_layer = layer
+        layer.fill(_LAYER_COLORKEY)
+        color = (100, 100, 100)
+        draw_rect = pygame.draw.rect
+        xs, ys, ws, hs = frame.x, frame.y, frame.w, frame.h
+        for i in range(n):
+            draw_rect(layer, color, (xs[i], ys[i], ws[i], hs[i]), 1)
+        self._boundary_key = key
+        return layer
+    
+    def _geometry_key(self, surface: pygame.Surface) -> Tuple[Any, ...]:
+        """Snapshot of the current frame's rects, for cache invalidation."""
+        frame = self.frame
+        n = frame.length
+        return (surface.get_size(), n,
+                frame.x[:n].tobytes(), frame.y[:n].tobytes(),
+                frame.w[:n].tobytes(), frame.h[:n].tobytes())
+    
+    def _heatmap_layer_for(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Return a translucent layer colouring each HEATMAP_CELL-sized cell by
+        how many tracked elements were drawn over it this frame.
+        """
+        key = self._geometry_key(surface)
+        if self._heatmap_layer is not None and key == self._heatmap_key:
+            return self._heatmap_layer
+        
+        width, height = surface.get_size()
+        cols = -(-width // HEATMAP_CELL)
+        rows = -(-height // HEATMAP_CELL)
+        counts = _coverage_counts(self.frame, cols, rows, HEATMAP_CELL)
+        
+        top = len(HEATMAP_COLORS) - 1
+        if np is not None:
+            covered = counts[counts > 0]
+            self._heatmap_stats = (int(counts.max()) if counts.size else 0,
+                                   float(covered.mean()) if covered.size else 0.0)
+            lut = np.array(HEATMAP_COLORS, dtype=np.uint8)
+            pixels = lut[np.minimum(counts, top)].tobytes()
+        else:
+            covered = [c for c in counts if c]
+            self._heatmap_stats = (max(counts, default=0),
+                                   sum(covered) / len(covered) if covered else 0.0)
+            lut = [bytes(color) for color in HEATMAP_COLORS]
+            pixels = b"".join([lut[min(c, top)] for c in counts])
+        
+        cells = pygame.image.frombuffer(pixels, (cols, rows), "RGB")
+        layer = pygame.transform.scale(cells, (cols * HEATMAP_CELL, rows * HEATMAP_CELL))
+        layer.set_colorkey(HEATMAP_COLORS[0])
+        layer.set_alpha(150)
+        self._heatmap_layer = layer
+        self._heatmap_key = key
+        return layer
+    
+    def _draw_heatmap_legend(self, surface: pygame.Surface) -> None:
+        """Draw the heatmap colour key and coverage stats in the top-left."""
+        font = self.overlay_font_small
+        peak, mean = self._heatmap_stats
+        x, y = 10, 10
+        for count, color in enumerate(HEATMAP_COLORS[1:], 1):
+            label = f"{count}+" if count == len(HEATMAP_COLORS) - 1 else str(count)
+            pygame.draw.rect(surface, color, (x, y, 14, 14))
+            surface.blit(font.render(label, True, (255, 255, 255)), (x + 18, y + 1))
+            x += 44
+        stats = f"Overdraw: max {peak}x, mean {mean:.1f}x"
+        surface.blit(font.render(stats, True, (255, 255, 255)), (10, y + 20))
+    
     def _draw_info_panel(self, surface: pygame.Surface, mouse_pos: Tuple[int, int]) -> None:
         """Draw info panel showing hovered element details."""
         if not self.hovered_elements:
             return
         
+        panel = self._info_panel()
+        panel_width, panel_height = panel.get_size()
+        
+        # Position panel near mouse but keep on screen
+        panel_x = mouse_pos[0] + 15
+        panel_y = mouse_pos[1] + 15
+        
+        if panel_x + panel_width > surface.get_width():
+            panel_x = mouse_pos[0] - panel_width - 15
+        if panel_y + panel_height > surface.get_height():
+            panel_y = mouse_pos[1] - panel_height - 15
+        
+        surface.blit(panel, (panel_x, panel_y))
+    
+    def _info_panel(self) -> pygame.Surface:
+        """
+        Return the rendered info panel for the hovered elements, reusing
+        the previous surface while the same elements stay under the cursor.
+        """
+        hovered = self.hovered_elements
+        key = (len(hovered),) + tuple(
+            (elem.name, elem.z_index, elem.callsite_id) for elem in hovered[:5])
+        if self._panel_surface is not None and key == self._panel_key:
+            return self._panel_surface
+        
         # Build info text
         lines = [
-            f"Elements at cursor: {len(self.hovered_elements)}",
+            f"Elements at cursor: {len(hovered)}",
             "─" * 30,
         ]
         
-        for elem in self.hovered_elements[:5]:  # Show top 5
+        for elem in hovered[:5]:  # Show top 5
             lines.append(f"• {elem.name} (z={elem.z_index})")
             if elem.source_stack:
                 loc = elem.source_stack[0]
                 lines.append(f"  {loc.filepath}:{loc.line}")
         
-        if len(self.hovered_elements) > 5:
-            lines.append(f"  ... and {len(self.hovered_elements) - 5} more")
+        if len(hovered) > 5:
+            lines.append(f"  ... and {len(hovered) - 5} more")
         
         lines.append("─" * 30)
         lines.append("Cmd+Click to open in Cursor")
@@ -391,28 +1048,15 @@ class IntrospectionSystem:
         panel_width = max_width + padding * 2
         panel_height = len(lines) * line_height + padding * 2
         
-        # Position panel near mouse but keep on screen
-        panel_x = mouse_pos[0] + 15
-        panel_y = mouse_pos[1] + 15
-        
-        if panel_x + panel_width > surface.get_width():
-            panel_x = mouse_pos[0] - panel_width - 15
-        if panel_y + panel_height > surface.get_height():
-            panel_y = mouse_pos[1] - panel_height - 15
-        
-        # Draw panel background
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        
         # Semi-transparent background
-        overlay_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        overlay_surface.fill((20, 20, 30, 230))
-        surface.blit(overlay_surface, (panel_x, panel_y))
+        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        panel.fill((20, 20, 30, 230))
         
         # Border
-        pygame.draw.rect(surface, (100, 200, 255), panel_rect, 2)
+        pygame.draw.rect(panel, (100, 200, 255), panel.get_rect(), 2)
         
         # Draw text
-        y = panel_y + padding
+        y = padding
         for line in lines:
             if line.startswith("─"):
                 color = (80, 80, 100)
@@ -426,8 +1070,77 @@ class IntrospectionSystem:
                 color = (255, 255, 255)
             
             text = self.overlay_font_small.render(line, True, color)
-            surface.blit(text, (panel_x + padding, y))
+            panel.blit(text, (padding, y))
             y += line_height
+        
+        self._panel_surface = panel
+        self._panel_key = key
+        return panel
+
+def _evaluate_metadata(raw: MetadataSpec) -> Dict[str, Any]:
+    """Turn a stored metadata spec into the dict shown on inspection."""
+    if raw is None or type(raw) is _Layer:
+        return {}
+    if type(raw) is tuple:
+        fields, values = raw
+        return dict(zip(fields, values))
+    if callable(raw):
+        return raw()
+    return raw
+
+
+def _coverage_counts(frame: FrameStore, cols: int, rows: int, cell: int):
+    """
+    Count how many of a frame's rects touch each cell of a cols x rows grid.
+    
+    Returns a (rows, cols) NumPy array when NumPy is available, otherwise a
+    flat row-major array('H').
+    """
+    n = frame.length
+    if np is not None:
+        x = np.frombuffer(frame.x, dtype=np.intc, count=n)
+        y = np.frombuffer(frame.y, dtype=np.intc, count=n)
+        w = np.frombuffer(frame.w, dtype=np.intc, count=n)
+        h = np.frombuffer(frame.h, dtype=np.intc, count=n)
+        c0 = np.clip(x // cell, 0, cols)
+        c1 = np.clip(-(-(x + w) // cell), 0, cols)
+        r0 = np.clip(y // cell, 0, rows)
+        r1 = np.clip(-(-(y + h) // cell), 0, rows)
+        keep = (w > 0) & (h > 0) & (c1 > c0) & (r1 > r0)
+        c0, c1, r0, r1 = c0[keep], c1[keep], r0[keep], r1[keep]
+        
+        # 2D difference array: +1 at each rect's top-left, -1 past its
+        # right and bottom edges; prefix sums turn it into coverage counts
+        diff = np.zeros((rows + 1, cols + 1), dtype=np.int32)
+        np.add.at(diff, (r0, c0), 1)
+        np.add.at(diff, (r0, c1), -1)
+        np.add.at(diff, (r1, c0), -1)
+        np.add.at(diff, (r1, c1), 1)
+        return diff.cumsum(axis=0).cumsum(axis=1)[:rows, :cols]
+    
+    counts = array('H', bytes(2 * cols * rows))
+    for i in range(n):
+        w, h = frame.w[i], frame.h[i]
+        if w <= 0 or h <= 0:
+            continue  # Nothing drawn
+        x, y = frame.x[i], frame.y[i]
+        c0 = min(max(x // cell, 0), cols)
+        c1 = min(max(-(-(x + w) // cell), 0), cols)
+        r0 = min(max(y // cell, 0), rows)
+        r1 = min(max(-(-(y + h) // cell), 0), rows)
+        for row in range(r0, r1):
+            base = row * cols
+            for col in range(c0 + base, c1 + base):
+                counts[col] += 1
+    return counts
+
+
+def _line_for_offset(code, lasti: int) -> int:
+    """Map a bytecode offset (frame.f_lasti) back to its source line."""
+    for start, end, line in code.co_lines():
+        if start <= lasti < end and line is not None:
+            return line
+    return code.co_firstlineno
 
 
 # Global instance
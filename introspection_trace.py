@@ -0,0 +1,196 @@
+"""
+Binary trace files for the introspection system.
+
+A trace is an append-only stream of frames recorded by IntrospectionSystem,
+so element counts, overdraw and hot call sites can be studied offline.
+
+Layout (all integers native-endian, byte order recorded in the header):
+
+    header   MAGIC, version, byte order flag, header size
+    frames   per frame: frame number, capture mode, element count, then the
+             name_id, x, y, w, h, z and callsite_id columns as int32 arrays
+    strings  element names, then call-site labels (u32 count, then u32
+             length + UTF-8 bytes per string)
+    index    u64 file offset of every frame
+    trailer  offsets of both string tables and the index, frame count, END
+
+The trailer has a fixed size, so a reader maps the file, reads the trailer
+and jumps straight to frame N through the index.
+
+Usage:
+    introspect.start_trace("session.chaintrace")
+    # ... play ...
+    introspect.stop_trace()
+
+    python introspection_trace.py session.chaintrace
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from collections import Counter
+from typing import List, NamedTuple, Sequence
+
+MAGIC = b"CHAINTRC"
+END = b"CTRE"
+VERSION = 1
+
+HEADER = struct.Struct("=8sHBx I")
+FRAME_HEADER = struct.Struct("=iiI")
+TRAILER = struct.Struct("=QQQI4s")
+
+# Per-frame int32 columns, in file order
+COLUMNS = ("name_id", "x", "y", "w", "h", "z", "callsite_id")
+
+# Capture modes as stored in the frame header
+MODES = ("off", "rects", "full")
+
+
+class TraceFrame(NamedTuple):
+    """One recorded frame; columns are int32 memoryviews into the trace."""
+    number: int
+    mode: str
+    name_id: memoryview
+    x: memoryview
+    y: memoryview
+    w: memoryview
+    h: memoryview
+    z: memoryview
+    callsite_id: memoryview
+
+    def __len__(self):
+        return len(self.x)
+
+
+class TraceWriter:
+    """Appends introspection frames to a trace file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION,
+                                    sys.byteorder == "little", HEADER.size))
+        self.offsets = array("Q")
+
+    def write_frame(self, frame) -> None:
+        """Append the elements of a FrameStore."""
+        n = frame.length
+        write = self.file.write
+        self.offsets.append(self.file.tell())
+        write(FRAME_HEADER.pack(frame.number, MODES.index(frame.mode), n))
+        for column in COLUMNS:
+            write(memoryview(getattr(frame, column))[:n])
+
+    def close(self, names: Sequence[str], callsites: Sequence[str]) -> None:
+        """Write the string tables, frame index and trailer."""
+        names_offset = self.file.tell()
+        self._write_strings(names)
+        callsites_offset = self.file.tell()
+        self._write_strings(callsites)
+        index_offset = self.file.tell()
+        self.file.write(self.offsets)
+        self.file.write(TRAILER.pack(names_offset, callsites_offset,
+                                     index_offset, len(self.offsets), END))
+        self.file.close()
+
+    def _write_strings(self, strings: Sequence[str]) -> None:
+        write = self.file.write
+        write(struct.pack("=I", len(strings)))
+        for string in strings:
+            data = string.encode("utf-8")
+            write(struct.pack("=I", len(data)))
+            write(data)
+
+
+class TraceReader:
+    """Memory-mapped view of a finished trace file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+
+        magic, version, little, _ = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} chain trace")
+        if little != (sys.byteorder == "little"):
+            raise ValueError(f"{path} was recorded with a different byte order")
+
+        (names_offset, callsites_offset, index_offset,
+         self.frame_count, end) = TRAILER.unpack_from(self.map, len(self.map) - TRAILER.size)
+        if end != END:
+            raise ValueError(f"{path} has no index (recording was not stopped)")
+
+        self.names = self._read_strings(names_offset)
+        self.callsites = self._read_strings(callsites_offset)
+        self.offsets = self.view[index_offset:index_offset + 8 * self.frame_count].cast("Q")
+
+    def __len__(self):
+        return self.frame_count
+
+    def frame(self, n: int) -> TraceFrame:
+        """Return the n-th recorded frame without touching any other."""
+        offset = self.offsets[n]
+        number, mode, count = FRAME_HEADER.unpack_from(self.map, offset)
+        offset += FRAME_HEADER.size
+        columns = []
+        for _ in COLUMNS:
+            columns.append(self.view[offset:offset + 4 * count].cast("i"))
+            offset += 4 * count
+        return TraceFrame(number, MODES[mode], *columns)
+
+    def _read_strings(self, offset: int) -> List[str]:
+        (count,) = struct.unpack_from("=I", self.map, offset)
+        offset += 4
+        strings = []
+        for _ in range(count):
+            (length,) = struct.unpack_from("=I", self.map, offset)
+            offset += 4
+            strings.append(bytes(self.view[offset:offset + length]).decode("utf-8"))
+            offset += length
+        return strings
+
+    def close(self) -> None:
+        self.offsets.release()
+        self.view.release()
+        self.map.close()
+
+
+def summarize(path: str, top: int = 10) -> None:
+    """Print element counts, pixel coverage and the busiest names/call sites."""
+    trace = TraceReader(path)
+    names = Counter()
+    callsites = Counter()
+    elements = 0
+    area = 0
+    for n in range(len(trace)):
+        frame = trace.frame(n)
+        elements += len(frame)
+        names.update(frame.name_id.tolist())
+        callsites.update(frame.callsite_id.tolist())
+        area += sum(w * h for w, h in zip(frame.w, frame.h))
+        for column in frame[2:]:
+            column.release()
+
+    frames = max(1, len(trace))
+    print(f"{path}: {len(trace)} frames, {elements / frames:.1f} elements/frame, "
+          f"{area / frames:.0f} px blitted/frame")
+
+    print("\nTop element names:")
+    for name_id, count in names.most_common(top):
+        print(f"  {count / frames:8.1f}/frame  {trace.names[name_id]}")
+
+    callsites.pop(-1, None)  # Geometry-only frames have no call sites
+    if callsites:
+        print("\nTop call sites:")
+        for callsite_id, count in callsites.most_common(top):
+            print(f"  {count / frames:8.1f}/frame  {trace.callsites[callsite_id]}")
+    trace.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: python introspection_trace.py TRACE_FILE")
+        sys.exit(1)
+    summarize(sys.argv[1])
@@ -6,17 +6,22 @@ import pygame
 from settings import *
 from sprites import (
     create_food_sprite, create_magic_vial_sprite,
-    create_heart_sprite, create_magic_sprite
+    create_heart_sprite, create_magic_sprite, create_key_sprite
 )
+from animation import Animation, get_animation
 from introspection import introspect
 
 
 class Item(pygame.sprite.Sprite):
     """Base item class"""
     
+    # Fields snapshotted for introspection metadata each time the item is drawn
+    INTROSPECT_FIELDS = ("item_type", ("world_x", "rect.x"), ("world_y", "rect.y"))
+    
     def __init__(self, x, y, item_type):
         super().__init__()
         self.item_type = item_type
+        self.introspect_name = f"item_{item_type}"
         self.frame = 0
         
         # Bobbing animation
@@ -24,12 +29,15 @@ class Item(pygame.sprite.Sprite):
         self.bob_offset = 0
         
         # Create sprite
-        self.update_sprite()
+        self.animation = self.create_animation()
+        self.image = self.animation.frame_at(0)
         self.rect = self.image.get_rect(topleft=(x, y))
     
-    def update_sprite(self):
-        """Override in subclasses"""
-        pass
+    def create_animation(self):
+        """Override in subclasses (the default is a still placeholder square)"""
+        placeholder = pygame.Surface((8 * PIXEL_SCALE, 8 * PIXEL_SCALE))
+        placeholder.fill(MAGENTA)
+        return Animation.still(placeholder)
     
     def update(self):
         """Update item animation"""
@@ -40,7 +48,7 @@ class Item(pygame.sprite.Sprite):
         self.bob_offset = int(math.sin(self.frame * 0.1) * 3)
         self.rect.y = self.base_y + self.bob_offset
         
-        self.update_sprite()
+        self.image = self.animation.frame_at(self.frame)
     
     def collect(self, player):
         """Called when player collects this item - override in subclasses"""
@@ -50,8 +58,8 @@ class Item(pygame.sprite.Sprite):
         """Draw item"""
         draw_x = self.rect.x - camera_offset[0]
         draw_y = self.rect.y - camera_offset[1]
-        introspect.draw(surface, self.image, (draw_x, draw_y), f"item_{self.item_type}",
-                       {"item_type": self.item_type, "world_x": self.rect.x, "world_y": self.rect.y})
+        introspect.draw(surface, self.image, (draw_x, draw_y), self.introspect_name,
+                       self.INTROSPECT_FIELDS, owner=self)
 
 
 class Food(Item):
@@ -66,8 +74,8 @@ class Food(Item):
         else:
             self.heal_amount = ITEM_TYPES['food']['heal']
     
-    def update_sprite(self):
-        self.image = create_food_sprite(self.food_type)
+    def create_animation(self):
+        return Animation.still(create_food_sprite(self.food_type))
     
     def collect(self, player):
         player.heal(self.heal_amount)
@@ -86,8 +94,8 @@ class MagicVial(Item):
         else:
             self.restore_amount = ITEM_TYPES['magic_vial']['restore']
     
-    def update_sprite(self):
-        self.image = create_magic_vial_sprite(self.vial_type)
+    def create_animation(self):
+        return Animation.still(create_magic_vial_sprite(self.vial_type))
     
     def collect(self, player):
         player.restore_magic(self.restore_amount)
@@ -101,8 +109,8 @@ class HeartContainer(Item):
         super().__init__(x, y, 'heart_container')
         self.increase_amount = ITEM_TYPES['heart_container']['max_health_increase']
     
-    def update_sprite(self):
-        self.image = create_heart_sprite(is_container=True)
+    def create_animation(self):
+        return Animation.still(create_heart_sprite(is_container=True))
     
     def collect(self, player):
         player.increase_max_health(self.increase_amount)
@@ -116,8 +124,8 @@ class MagicBottle(Item):
         super().__init__(x, y, 'magic_bottle')
         self.increase_amount = ITEM_TYPES['magic_bottle']['max_magic_increase']
     
-    def update_sprite(self):
-        self.image = create_magic_sprite(is_bottle=True)
+    def create_animation(self):
+        return Animation.still(create_magic_sprite(is_bottle=True))
     
     def collect(self, player):
         player.increase_max_magic(self.increase_amount)
@@ -131,34 +139,9 @@ class Coin(Item):
         self.value = value
         super().__init__(x, y, 'coin')
     
-    def update_sprite(self):
-        # Create coin sprite
-        size = 10
-        surface = pygame.Surface((size * PIXEL_SCALE, size * PIXEL_SCALE), pygame.SRCALPHA)
-        
-        # Animated rotation effect
-        frame_mod = self.frame % 20
-        if frame_mod < 5:
-            width = 8
-        elif frame_mod < 10:
-            width = 6
-        elif frame_mod < 15:
-            width = 4
-        else:
-            width = 6
-        
-        x_offset = (10 - width) // 2
-        
-        # Draw coin
-        scaled_width = width * PIXEL_SCALE
-        scaled_x = x_offset * PIXEL_SCALE
-        
-        pygame.draw.rect(surface, YELLOW, 
-                        (scaled_x, 2 * PIXEL_SCALE, scaled_width, 6 * PIXEL_SCALE))
-        pygame.draw.rect(surface, ORANGE, 
-                        (scaled_x, 6 * PIXEL_SCALE, scaled_width, 2 * PIXEL_SCALE))
-        
-        self.image = surface
+    def create_animation(self):
+        # Spinning coin
+        return get_animation('coin')
     
     def collect(self, player):
         player.add_score(self.value)
@@ -172,22 +155,8 @@ class Key(Item):
         self.key_id = key_id
         super().__init__(x, y, 'key')
     
-    def update_sprite(self):
-        # Create key sprite
-        size = 12
-        surface = pygame.Surface((size * PIXEL_SCALE, size * PIXEL_SCALE), pygame.SRCALPHA)
-        
-        # Key shape
-        pygame.draw.rect(surface, YELLOW, 
-                        (2 * PIXEL_SCALE, 2 * PIXEL_SCALE, 4 * PIXEL_SCALE, 4 * PIXEL_SCALE))
-        pygame.draw.rect(surface, YELLOW, 
-                        (4 * PIXEL_SCALE, 5 * PIXEL_SCALE, 2 * PIXEL_SCALE, 6 * PIXEL_SCALE))
-        pygame.draw.rect(surface, YELLOW, 
-                        (2 * PIXEL_SCALE, 8 * PIXEL_SCALE, 2 * PIXEL_SCALE, 2 * PIXEL_SCALE))
-        pygame.draw.rect(surface, ORANGE, 
-                        (3 * PIXEL_SCALE, 3 * PIXEL_SCALE, 2 * PIXEL_SCALE, 2 * PIXEL_SCALE))
-        
-        self.image = surface
+    def create_animation(self):
+        return Animation.still(create_key_sprite())
     
     def collect(self, player):
         # Add key to player inventory (would need to implement inventory)
@@ -4,8 +4,10 @@ Side-scroller level system for Chain
 
 import pygame
 import random
+from array import array
+from functools import partial
 from settings import *
-from sprites import create_tile_sprite
+from sprites import create_tile_sprite, finalize_surface
 from enemies import create_enemy
 from items import create_item, ItemManager
 from introspection import introspect
@@ -22,6 +24,348 @@ class Tile(pygame.sprite.Sprite):
         self.tile_type = tile_type
         self.image = create_tile_sprite(tile_type, variant)
         self.rect = self.image.get_rect(topleft=(x, y))
+        
+
+class TileMap:
+    """
+    Dense grid of tile ids: the canonical terrain of a level.
+    
+    Cell (col, row) is the Tile.SIZE square at (col * size, origin_y +
+    row * size). Id 0 is empty; other ids index kinds, the distinct
+    (tile_type, variant) pairs, and their shared images. Tile sprites only
+    exist as views, created when something asks for one.
+    
+    Tiles keep the exact positions the generators give them: the ones off
+    the grid (or on a cell that is already filled) go to a sparse side
+    store, bucketed by the cell of their top-left corner, that every lookup
+    reads too. Lookups return tiles as entries, (order, x, y, kind id), in
+    the order they were placed, which collision response depends on.
+    
+    Terrain never changes once generated, so render_chunks() can pre-render
+    it into CHUNK_SIZE squares that are drawn instead of single tiles
+    (see PRERENDER_TERRAIN).
+    """
+    
+    CHUNK_SIZE = 512
+    
+    def __init__(self, width, height, align_y=0, size=Tile.SIZE):
+        self.size = size
+        # Rows start at align_y (usually the ground) and reach up to y = 0
+        self.origin_y = align_y % size - size if align_y % size else 0
+        self.cols = -(-width // size)
+        self.rows = -(-(height - self.origin_y) // size)
+        self.cells = bytearray(self.cols * self.rows)
+        self.order = array('I', [0]) * len(self.cells)  # cell index -> placement order
+        self.count = 0
+        
+        self.loose = []       # Entries of the tiles off the grid
+        self.buckets = {}     # (col, row) -> indexes into loose
+    
+        self.kinds = [None]   # id -> (tile_type, variant)
+        self.images = [None]  # id -> tile sprite
+        self.names = [None]   # id -> introspection name
+        self.kind_ids = {}
+        self.views = {}       # placement order -> Tile
+        self.chunks = {}      # (chunk col, chunk row) -> surface
+        self.chunk_pieces = {}  # (chunk col, chunk row) -> chunk-relative tile rects
+    
+    def kind_id(self, tile_type, variant=0):
+        """Id of a tile kind, registering it on first use."""
+        kind = create_tile_sprite.normalize(tile_type, variant)
+        kind_id = self.kind_ids.get(kind)
+        if kind_id is None:
+            kind_id = len(self.kinds)
+            self.kind_ids[kind] = kind_id
+            self.kinds.append(kind)
+            self.images.append(create_tile_sprite(*kind))
+            self.names.append(f"tile_{tile_type}")
+        return kind_id
+    
+    def set(self, x, y, tile_type, variant=0):
+        """Place a tile with its top-left corner at pixel position (x, y)."""
+        kind = self.kind_id(tile_type, variant)
+        order = self.count
+        self.count += 1
+        col, col_offset = divmod(x, self.size)
+        row, row_offset = divmod(y - self.origin_y, self.size)
+        index = row * self.cols + col
+        if (not col_offset and not row_offset and 0 <= col < self.cols and
+                0 <= row < self.rows and not self.cells[index]):
+            self.cells[index] = kind
+            self.order[index] = order
+        else:
+            self.buckets.setdefault((col, row), []).append(len(self.loose))
+            self.loose.append((order, x, y, kind))
+    
+    def cell_position(self, index):
+        """World position of the top-left corner of a cell."""
+        row, col = divmod(index, self.cols)
+        return col * self.size, self.origin_y + row * self.size
+    
+    def cell_entry(self, index):
+        """Entry of the tile in a non-empty cell."""
+        return (self.order[index], *self.cell_position(index), self.cells[index])
+    
+    def metadata(self, x, y, kind):
+        """Introspection metadata for a tile."""
+        return {"tile_type": self.kinds[kind][0], "world_x": x, "world_y": y}
+    
+    def tile(self, entry):
+        """The Tile view of an entry."""
+        order, x, y, kind = entry
+        tile = self.views.get(order)
+        if tile is None:
+            tile = self.views[order] = Tile(x, y, *self.kinds[kind])
+        return tile
+    
+    def cell_range(self, rect):
+        """
+        (col_start, col_end, row_start, row_end) of the cells overlapping a
+        world rect, clamped to the map.
+        """
+        size = self.size
+        return (max(rect.left // size, 0),
+                min((rect.right - 1) // size + 1, self.cols),
+                max((rect.top - self.origin_y) // size, 0),
+                min((rect.bottom - 1 - self.origin_y) // size + 1, self.rows))
+    
+    def entries(self):
+        """Entries of every tile, in placement order."""
+        found = [self.cell_entry(index) for index, kind in enumerate(self.cells) if kind]
+        found.extend(self.loose)
+        found.sort()
+        return found
+    
+    def entries_in(self, rect):
+        """Entries of the tiles overlapping a world rect, in placement order."""
+        col_start, col_end, row_start, row_end = self.cell_range(rect)
+        cells = self.cells
+        cols = self.cols
+        found = []
+        for row in range(row_start, row_end):
+            for index in range(row * cols + col_start, row * cols + col_end):
+                if cells[index]:
+                    found.append(self.cell_entry(index))
+        
+        if self.loose:
+            # A loose tile reaches into the cells right of and below its bucket
+            size = self.size
+            for row in range((rect.top - self.origin_y) // size - 1,
+                             (rect.bottom - 1 - self.origin_y) // size + 1):
+                for col in range(rect.left // size - 1, (rect.right - 1) // size + 1):
+                    for i in self.buckets.get((col, row), ()):
+                        entry = self.loose[i]
+                        if rect.colliderect((entry[1], entry[2], size, size)):
+                            found.append(entry)
+        found.sort()
+        return found
+    
+    def render_chunks(self):
+        """Pre-render every non-empty chunk of the map."""
+        chunk_size = self.CHUNK_SIZE
+        size = self.size
+        
+        # Tiles can straddle chunks; each chunk is cropped to what it holds
+        blits = []
+        extents = {}
+        for _, x, y, kind in self.entries():
+            y -= self.origin_y
+            for row in range(y // chunk_size, (y + size - 1) // chunk_size + 1):
+                for col in range(x // chunk_size, (x + size - 1) // chunk_size + 1):
+                    pos = (x - col * chunk_size, y - row * chunk_size)
+                    blits.append(((col, row), pos, kind))
+                    width, height = extents.get((col, row), (0, 0))
+                    extents[col, row] = (max(width, min(pos[0] + size, chunk_size)),
+                                         max(height, min(pos[1] + size, chunk_size)))
+        
+        self.chunks = {key: pygame.Surface(extent, pygame.SRCALPHA)
+                       for key, extent in extents.items()}
+        self.chunk_pieces = {key: [] for key in extents}
+        for key, (x, y), kind in blits:
+            self.chunks[key].blit(self.images[kind], (x, y))
+            # The part of the tile inside the chunk, for introspection coverage
+            left, top = max(x, 0), max(y, 0)
+            self.chunk_pieces[key].append((left, top, min(x + size, chunk_size) - left,
+                                           min(y + size, chunk_size) - top))
+        
+        # Colour keyed + RLE: chunks are mostly empty and never drawn on again
+        for key, chunk in self.chunks.items():
+            self.chunks[key] = finalize_surface(chunk)
+    
+    def chunks_in(self, rect):
+        """
+        Yield (world position, surface, tile rects) of the chunks overlapping
+        a world rect.
+        """
+        chunk_size = self.CHUNK_SIZE
+        for row in range((rect.top - self.origin_y) // chunk_size,
+                         (rect.bottom - 1 - self.origin_y) // chunk_size + 1):
+            for col in range(rect.left // chunk_size, (rect.right - 1) // chunk_size + 1):
+                chunk = self.chunks.get((col, row))
+                if chunk is not None:
+                    yield ((col * chunk_size, self.origin_y + row * chunk_size), chunk,
+                           self.chunk_pieces[col, row])
+    
+    def hit_test(self, chunk_x, chunk_y, x, y):
+        """
+        Introspection lookup for a chunk at world (chunk_x, chunk_y): the
+        topmost tile under chunk-relative point (x, y), as (name, rect,
+        metadata).
+        """
+        found = self.entries_in(pygame.Rect(chunk_x + x, chunk_y + y, 1, 1))
+        if not found:
+            return None
+        _, tile_x, tile_y, kind = found[-1]
+        rect = pygame.Rect(tile_x - chunk_x, tile_y - chunk_y, self.size, self.size)
+        return self.names[kind], rect, partial(self.metadata, tile_x, tile_y, kind)
+    
+    def tiles(self):
+        """Views of every tile, in placement order."""
+        return [self.tile(entry) for entry in self.entries()]
+    
+    def query(self, rect, dx=0, dy=0):
+        """
+        Tiles that can touch rect while it moves by (dx, dy), in placement
+        order.
+        """
+        # A pixel of slack either side for fractional velocities
+        swept = rect.union(rect.move(dx, dy)).inflate(2, 2)
+        return [self.tile(entry) for entry in self.entries_in(swept)]
+
+
+class ParallaxLayer:
+    """
+    One scrolling layer of a level background: a strip that repeats every
+    `period` pixels and moves at `factor` times the camera speed. Give the
+    farthest layer a fill colour so it is opaque and covers the screen.
+    """
+    
+    def __init__(self, period, factor, fill=None):
+        self.period = period
+        self.factor = factor
+        self.fill = fill
+        if fill:
+            self.image = pygame.Surface((period, SCREEN_HEIGHT))
+            self.image.fill(fill)
+        else:
+            self.image = pygame.Surface((period, SCREEN_HEIGHT), pygame.SRCALPHA)
+    
+    def paint(self, x, draw):
+        """
+        Call draw(image, x) for a shape at x, and again a period either
+        side, so shapes crossing the strip's edges tile seamlessly.
+        """
+        x %= self.period
+        for wrapped_x in (x - self.period, x, x + self.period):
+            draw(self.image, wrapped_x)
+    
+    def finish(self):
+        """Convert the painted strip for blitting; it must not be painted on again."""
+        if not self.fill:
+            self.image = finalize_surface(self.image)
+        elif pygame.display.get_surface() is not None:
+            self.image = self.image.convert()
+        return self
+    
+    def draw(self, surface, camera_x):
+        x = -(int(camera_x * self.factor) % self.period)
+        while x < SCREEN_WIDTH:
+            surface.blit(self.image, (x, 0))
+            x += self.period
+
+
+class Background:
+    """
+    A level background: parallax layers, farthest (and opaque) first, and
+    an optional full-screen overlay whose alpha is set per frame.
+    """
+    
+    def __init__(self, layers, overlay=None):
+        self.layers = layers
+        self.overlay = overlay
+    
+    @classmethod
+    def build(cls, kind):
+        """Render the background for a kind from Level.get_background_kind()"""
+        if kind == 'cave':
+            # Cave atmosphere
+            rocks = ParallaxLayer(SCREEN_WIDTH, 0.2, DARK_BROWN)
+            for i in range(20):
+                y = (i * 89) % SCREEN_HEIGHT
+                rocks.paint(i * 157, lambda image, x: pygame.draw.circle(image, BROWN, (x, y), 30))
+            return cls([rocks.finish()])
+        
+        if kind == 'fortress':
+            # Cannon's Domain - dark and foreboding
+            # Ominous red glow from below
+            glow = ParallaxLayer(840, 0.1, DARK_BLUE)  # 7 repeats of the 3-bar pattern
+            for i in range(21):
+                glow_height = 100 + (i % 3) * 30
+                glow.paint(i * 40, lambda image, x: pygame.draw.rect(
+                    image, DARK_RED, (x, SCREEN_HEIGHT - glow_height, 35, glow_height)))
+            # Dark pillars
+            pillars = ParallaxLayer(SCREEN_WIDTH + 150, 0.15)
+            
+            def pillar(image, x):
+                pygame.draw.rect(image, NAVY, (x, 0, 60, SCREEN_HEIGHT))
+                pygame.draw.rect(image, DARK_BROWN, (x + 10, 0, 40, SCREEN_HEIGHT))
+            
+            for i in range(12):
+                pillars.paint(i * 180, pillar)
+            # Chains hanging from ceiling
+            chains = ParallaxLayer(SCREEN_WIDTH + 200, 0.2)
+            
+            def chain(image, x):
+                for j in range(6):
+                    pygame.draw.rect(image, GRAY, (x + 5, j * 25, 10, 20))
+            
+            for i in range(8):
+                chains.paint(i * 250, chain)
+            return cls([glow.finish(), pillars.finish(), chains.finish()])
+        
+        if kind == 'castle':
+            # Castle interior
+            columns = ParallaxLayer(SCREEN_WIDTH + 100, 0.1, NAVY)
+            for i in range(10):
+                columns.paint(i * 200, lambda image, x: pygame.draw.rect(
+                    image, DARK_BLUE, (x, 0, 80, SCREEN_HEIGHT)))
+            return cls([columns.finish()])
+        
+        if kind == 'boss':
+            # Ominous atmosphere
+            frames = ParallaxLayer(SCREEN_WIDTH, 0, DARK_RED)
+            for i in range(5):
+                frames.paint(SCREEN_WIDTH // 2 + (i - 2) * 150, lambda image, x: pygame.draw.rect(
+                    image, RED, (x, 0, 20, SCREEN_HEIGHT), 1))
+            # Pulsing glow, blended at a different alpha each frame
+            glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            if pygame.display.get_surface() is not None:
+                glow = glow.convert()
+            glow.fill(RED)
+            return cls([frames.finish()], glow)
+        
+        # Forest background
+        # Clouds
+        clouds = ParallaxLayer(SCREEN_WIDTH + 200, 0.3, SKY_BLUE)
+        for i in range(8):
+            clouds.paint(i * 200, lambda image, x: pygame.draw.ellipse(
+                image, WHITE, (x, 50 + i * 20, 100, 40)))
+        # Distant trees
+        trees = ParallaxLayer(SCREEN_WIDTH + 100, 0.5)
+        
+        def tree(image, x):
+            pygame.draw.rect(image, DARK_GREEN, (x, 300, 40, 200))
+            pygame.draw.polygon(image, GREEN, [
+                (x - 20, 300), (x + 20, 200), (x + 60, 300)
+            ])
+        
+        for i in range(15):
+            trees.paint(i * 150, tree)
+        return cls([clouds.finish(), trees.finish()])
+
+
+# Rendered backgrounds by kind, shared by every level that uses one
+backgrounds = {}
 
 
 class Level:
@@ -31,7 +375,7 @@ class Level:
         self.level_id = level_id
         self.level_type = level_type
         
-        self.tiles = pygame.sprite.Group()
+        self.tilemap = None
         self.enemies = pygame.sprite.Group()
         self.item_manager = ItemManager()
         
@@ -54,9 +398,18 @@ class Level:
         # Level name
         self.name = self.get_level_name()
         
+        # Static introspection metadata (reused every frame)
+        self.introspect_metadata = {"level_id": self.level_id, "level_type": self.level_type}
+        
         # Generate level
         self.generate()
     
+        # Parallax backgrounds are rendered once per kind and shared
+        kind = self.get_background_kind()
+        if kind not in backgrounds:
+            backgrounds[kind] = Background.build(kind)
+        self.background = backgrounds[kind]
+    
     def get_level_name(self):
         """Get display name for level"""
         names = {
@@ -67,6 +420,18 @@ class Level:
         }
         return names.get(self.level_id, 'Unknown Area')
     
+    def get_background_kind(self):
+        """Which background the level draws (the fortress has its own)"""
+        if self.level_type == LEVEL_CAVE:
+            return 'cave'
+        if self.level_id == 'fortress':
+            return 'fortress'
+        if self.level_type == LEVEL_CASTLE:
+            return 'castle'
+        if self.level_type == LEVEL_BOSS:
+            return 'boss'
+        return 'forest'
+    
     def generate(self):
         """Generate level based on type"""
         if self.level_id == 'castle':
@@ -79,7 +444,10 @@ class Level:
             self.generate_boss_level()
         else:
             self.generate_forest_level()
-    
+        
+        if PRERENDER_TERRAIN:
+            self.tilemap.render_chunks()
+        
     def generate_forest_level(self):
         """Generate a forest-themed level"""
         ts = Tile.SIZE  # Actual tile size (32 pixels)
@@ -90,9 +458,10 @@ class Level:
         
         # Ground
         ground_y = self.height - ts * 2
+        self.tilemap = TileMap(self.width, self.height, align_y=ground_y)
         for x in range(0, self.width, ts):
-            self.tiles.add(Tile(x, ground_y, 'grass', x // ts))
-            self.tiles.add(Tile(x, ground_y + ts, 'dirt', x // ts))
+            self.tilemap.set(x, ground_y, 'grass', x // ts)
+            self.tilemap.set(x, ground_y + ts, 'dirt', x // ts)
         
         # Platforms
         platforms = [
@@ -108,7 +477,7 @@ class Level:
         
         for px, py, length in platforms:
             for i in range(length):
-                self.tiles.add(Tile(px + i * ts, py, 'grass'))
+                self.tilemap.set(px + i * ts, py, 'grass')
         
         # Enemies
         self.enemies.add(create_enemy('slime', 400, ground_y - ts))
@@ -141,9 +510,10 @@ class Level:
         
         # Ground
         ground_y = self.height - ts * 2
+        self.tilemap = TileMap(self.width, self.height, align_y=ground_y)
         for x in range(0, self.width, ts):
-            self.tiles.add(Tile(x, ground_y, 'brick', x // ts))
-            self.tiles.add(Tile(x, ground_y + ts, 'stone', x // ts))
+            self.tilemap.set(x, ground_y, 'brick', x // ts)
+            self.tilemap.set(x, ground_y + ts, 'stone', x // ts)
         
         # Castle platforms and structure
         platforms = [
@@ -158,7 +528,7 @@ class Level:
         
         for px, py, length, tile_type in platforms:
             for i in range(length):
-                self.tiles.add(Tile(px + i * ts, py, tile_type))
+                self.tilemap.set(px + i * ts, py, tile_type)
         
         # Enemies - more knights in castle
         self.enemies.add(create_enemy('knight', 300, ground_y - ts))
@@ -191,14 +561,15 @@ class Level:
         
         # Cave floor and ceiling
         ground_y = self.height - ts * 2
+        self.tilemap = TileMap(self.width, self.height, align_y=ground_y)
         
         for x in range(0, self.width, ts):
             # Floor
-            self.tiles.add(Tile(x, ground_y, 'stone', x // ts))
-            self.tiles.add(Tile(x, ground_y + ts, 'stone', x // ts))
+            self.tilemap.set(x, ground_y, 'stone', x // ts)
+            self.tilemap.set(x, ground_y + ts, 'stone', x // ts)
             # Ceiling
-            self.tiles.add(Tile(x, 0, 'stone', x // ts))
-            self.tiles.add(Tile(x, ts, 'stone', x // ts))
+            self.tilemap.set(x, 0, 'stone', x // ts)
+            self.tilemap.set(x, ts, 'stone', x // ts)
         
         # Cave platforms (more varied heights)
         platforms = [
@@ -217,7 +588,7 @@ class Level:
         
         for px, py, length, tile_type in platforms:
             for i in range(length):
-                self.tiles.add(Tile(px + i * ts, py, tile_type))
+                self.tilemap.set(px + i * ts, py, tile_type)
         
         # Lots of bats in cave
         self.enemies.add(create_enemy('bat', 300, ground_y - ts * 4))
@@ -258,6 +629,7 @@ class Level:
         
         # Fortress floor and walls
         ground_y = self.height - ts * 2
+        self.tilemap = TileMap(self.width, self.height, align_y=ground_y)
         
         # Ground with gaps (hazards!)
         gap_positions = [600, 1200, 1800, 2400, 3000, 3400]
@@ -265,13 +637,13 @@ class Level:
             # Check if this is a gap
             is_gap = any(gap <= x < gap + ts * 3 for gap in gap_positions)
             if not is_gap:
-                self.tiles.add(Tile(x, ground_y, 'brick', x // ts))
-                self.tiles.add(Tile(x, ground_y + ts, 'stone', x // ts))
+                self.tilemap.set(x, ground_y, 'brick', x // ts)
+                self.tilemap.set(x, ground_y + ts, 'stone', x // ts)
         
         # Ceiling
         for x in range(0, self.width, ts):
-            self.tiles.add(Tile(x, 0, 'stone', x // ts))
-            self.tiles.add(Tile(x, ts, 'stone', x // ts))
+            self.tilemap.set(x, 0, 'stone', x // ts)
+            self.tilemap.set(x, ts, 'stone', x // ts)
         
         # Complex platform layout - requires precise jumping
         platforms = [
@@ -318,7 +690,7 @@ class Level:
         
         for px, py, length, tile_type in platforms:
             for i in range(length):
-                self.tiles.add(Tile(px + i * ts, py, tile_type))
+                self.tilemap.set(px + i * ts, py, tile_type)
         
         # MANY enemies - this is the hard level!
         # Section 1
@@ -386,14 +758,15 @@ class Level:
         
         # Arena floor
         ground_y = self.height - ts * 2
+        self.tilemap = TileMap(self.width, self.height, align_y=ground_y)
         for x in range(0, self.width, ts):
-            self.tiles.add(Tile(x, ground_y, 'brick', x // ts))
-            self.tiles.add(Tile(x, ground_y + ts, 'stone', x // ts))
+            self.tilemap.set(x, ground_y, 'brick', x // ts)
+            self.tilemap.set(x, ground_y + ts, 'stone', x // ts)
         
         # Arena walls
         for y in range(0, ground_y, ts):
-            self.tiles.add(Tile(0, y, 'stone'))
-            self.tiles.add(Tile(self.width - ts, y, 'stone'))
+            self.tilemap.set(0, y, 'stone')
+            self.tilemap.set(self.width - ts, y, 'stone')
         
         # Some platforms for dodging
         platforms = [
@@ -404,7 +777,7 @@ class Level:
         
         for px, py, length, tile_type in platforms:
             for i in range(length):
-                self.tiles.add(Tile(px + i * ts, py, tile_type))
+                self.tilemap.set(px + i * ts, py, tile_type)
         
         # THE BOSS - Cannon!
         self.enemies.add(create_enemy('cannon', 700, ground_y - ts * 2))
@@ -422,8 +795,8 @@ class Level:
         self.start_y = ground_y - ts
     
     def get_tiles(self):
-        """Get all tiles for collision"""
-        return self.tiles.sprites()
+        """Get views of all tiles (prefer tilemap.query for collision)"""
+        return self.tilemap.tiles()
     
     def update_camera(self, player):
         """Update camera to follow player"""
@@ -444,9 +817,8 @@ class Level:
         self.update_camera(player)
         
         # Update enemies
-        tiles = self.get_tiles()
         for enemy in self.enemies:
-            enemy.update(player, tiles)
+            enemy.update(player, self.tilemap)
         
         # Update items
         self.item_manager.update()
@@ -472,22 +844,27 @@ class Level:
         
         # Track background region
         introspect.track_region(
-            pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT),
+            (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT),
             f"level_background_{self.level_type}",
-            {"level_id": self.level_id, "level_type": self.level_type}
+            self.introspect_metadata
         )
         
-        # Draw tiles
-        for tile in self.tiles:
-            draw_x = tile.rect.x - camera_offset[0]
-            draw_y = tile.rect.y - camera_offset[1]
-            
-            # Only draw visible tiles
-            if (-TILE_SIZE * PIXEL_SCALE < draw_x < SCREEN_WIDTH + TILE_SIZE * PIXEL_SCALE and
-                -TILE_SIZE * PIXEL_SCALE < draw_y < SCREEN_HEIGHT + TILE_SIZE * PIXEL_SCALE):
-                introspect.draw(surface, tile.image, (draw_x, draw_y), 
-                               f"tile_{tile.tile_type}",
-                               {"tile_type": tile.tile_type, "world_x": tile.rect.x, "world_y": tile.rect.y})
+        # Only the cells under the camera are visited, so the cost depends
+        # on the screen size rather than the level length
+        tilemap = self.tilemap
+        view = pygame.Rect(camera_offset, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        if PRERENDER_TERRAIN:
+            # Pre-rendered terrain; introspection maps points on a chunk
+            # back to single tiles
+            for (x, y), chunk, pieces in tilemap.chunks_in(view):
+                introspect.draw_layer(surface, chunk, (x - camera_offset[0], y - camera_offset[1]),
+                                      "level_terrain", partial(tilemap.hit_test, x, y), pieces)
+        else:
+            # Tile by tile, in the order they were placed
+            for _, x, y, kind in tilemap.entries_in(view):
+                introspect.draw(surface, tilemap.images[kind],
+                               (x - camera_offset[0], y - camera_offset[1]),
+                               tilemap.names[kind], partial(tilemap.metadata, x, y, kind))
         
         # Draw exit
         if self.exit_rect:
@@ -502,7 +879,7 @@ class Level:
                 (exit_x + 6, exit_y + 25)
             ])
             introspect.track_region(exit_screen_rect, "level_exit",
-                                   {"level_id": self.level_id})
+                                   ("level_id",), owner=self)
         
         # Draw items
         self.item_manager.draw(surface, camera_offset)
@@ -513,59 +890,13 @@ class Level:
     
     def draw_background(self, surface):
         """Draw level background"""
-        if self.level_type == LEVEL_CAVE:
-            surface.fill(DARK_BROWN)
-            # Cave atmosphere
-            for i in range(20):
-                x = (i * 157 - int(self.camera_x * 0.2)) % SCREEN_WIDTH
-                y = (i * 89) % SCREEN_HEIGHT
-                pygame.draw.circle(surface, BROWN, (x, y), 30)
-        elif self.level_id == 'fortress':
-            # Cannon's Domain - dark and foreboding
-            surface.fill(DARK_BLUE)
-            # Ominous red glow from below
-            for i in range(SCREEN_WIDTH // 40):
-                x = i * 40 - int(self.camera_x * 0.1) % 40
-                glow_height = 100 + (i % 3) * 30
-                pygame.draw.rect(surface, (*DARK_RED[:3], 50), 
-                               (x, SCREEN_HEIGHT - glow_height, 35, glow_height))
-            # Dark pillars
-            for i in range(12):
-                x = (i * 180 - int(self.camera_x * 0.15)) % (SCREEN_WIDTH + 150)
-                pygame.draw.rect(surface, NAVY, (x, 0, 60, SCREEN_HEIGHT))
-                pygame.draw.rect(surface, DARK_BROWN, (x + 10, 0, 40, SCREEN_HEIGHT))
-            # Chains hanging from ceiling
-            for i in range(8):
-                x = (i * 250 - int(self.camera_x * 0.2)) % (SCREEN_WIDTH + 200)
-                for j in range(6):
-                    pygame.draw.rect(surface, GRAY, (x + 5, j * 25, 10, 20))
-        elif self.level_type == LEVEL_CASTLE:
-            surface.fill(NAVY)
-            # Castle interior
-            for i in range(10):
-                x = (i * 200 - int(self.camera_x * 0.1)) % (SCREEN_WIDTH + 100)
-                pygame.draw.rect(surface, DARK_BLUE, (x, 0, 80, SCREEN_HEIGHT))
-        elif self.level_type == LEVEL_BOSS:
-            surface.fill(DARK_RED)
-            # Ominous atmosphere
-            for i in range(5):
-                x = SCREEN_WIDTH // 2 + (i - 2) * 150
-                pygame.draw.rect(surface, RED, (x, 0, 20, SCREEN_HEIGHT), 1)
+        background = self.background
+        for layer in background.layers:
+            layer.draw(surface, self.camera_x)
+        
+        if background.overlay:
             # Pulsing glow effect
             import math
             pulse = int(abs(math.sin(pygame.time.get_ticks() * 0.002)) * 30)
-            pygame.draw.rect(surface, (*RED[:3], pulse), (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
-        else:
-            # Forest background
-            surface.fill(SKY_BLUE)
-            # Clouds
-            for i in range(8):
-                x = (i * 200 - int(self.camera_x * 0.3)) % (SCREEN_WIDTH + 200)
-                pygame.draw.ellipse(surface, WHITE, (x, 50 + i * 20, 100, 40))
-            # Distant trees
-            for i in range(15):
-                x = (i * 150 - int(self.camera_x * 0.5)) % (SCREEN_WIDTH + 100)
-                pygame.draw.rect(surface, DARK_GREEN, (x, 300, 40, 200))
-                pygame.draw.polygon(surface, GREEN, [
-                    (x - 20, 300), (x + 20, 200), (x + 60, 300)
-                ])
+            background.overlay.set_alpha(pulse)
+            surface.blit(background.overlay, (0, 0))
@@ -0,0 +1,79 @@
+"""
+Background asset loading for Chain
+
+Baking the sprite atlas and synthesizing every sound effect and music track
+takes a few seconds. AssetLoader runs that work on a thread pool while the
+main menu is already on screen, and hands each finished asset over to the
+game on the main thread.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import atlas
+
+
+class AssetLoader:
+    """Loads the sprite atlas and sounds in the background."""
+    
+    def __init__(self, sound_manager, max_workers=3):
+        self.sound = sound_manager
+        self.max_workers = max_workers
+        self.executor = None
+        self.pending = {}  # Future -> (kind, name) of the asset it makes
+        self.total = 0
+    
+    def start(self):
+        """Submit every asset job to the pool."""
+        self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='chain-assets')
+        self.pending[self.executor.submit(atlas.load_or_bake)] = ('atlas', None)
+        
+        # Music first: it's the slowest, and the menu wants its track soon
+        for name, make in self.sound.music_recipes().items():
+            self.pending[self.executor.submit(make)] = ('music', name)
+        for name, make in self.sound.sound_recipes().items():
+            self.pending[self.executor.submit(make)] = ('sounds', name)
+        self.total = len(self.pending)
+    
+    def _install(self, future):
+        """Hand a finished job's result over to the game."""
+        kind, name = self.pending.pop(future)
+        result = future.result()
+        if kind == 'atlas':
+            atlas.use_atlas(*result)
+        else:
+            getattr(self.sound, kind)[name] = result
+    
+    @property
+    def done(self):
+        return self.executor is not None and not self.pending
+    
+    @property
+    def progress(self):
+        """Fraction of assets installed so far, from 0.0 to 1.0."""
+        if not self.total:
+            return 0.0
+        return 1.0 - len(self.pending) / self.total
+    
+    def poll(self):
+        """Install whatever has finished. Call once per frame from the main thread."""
+        for future in [f for f in self.pending if f.done()]:
+            self._install(future)
+        if self.done:
+            self.executor.shutdown()
+    
+    def finish(self):
+        """Block until every asset is loaded and installed."""
+        if self.executor is None:
+            self.start()
+        for future in list(self.pending):
+            self._install(future)
+        self.executor.shutdown()
+    
+    def close(self):
+        """
+        Drop every job that hasn't finished, e.g. when quitting from the
+        menu. Queued jobs are cancelled; running ones are left to finish.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending.clear()
@@ -4,9 +4,7 @@ Player (Chain) class for the game
 
 import pygame
 from settings import *
-from sprites import (create_chain_sprite, create_chain_attack_sprite, 
-                     create_chain_up_attack_sprite, create_chain_down_attack_sprite,
-                     create_chain_world_sprite)
+from sprites import get_sprite, indexed_sprite, solid_sprite
 from spells import SpellManager
 from introspection import introspect
 
@@ -14,6 +12,11 @@ from introspection import introspect
 class Player(pygame.sprite.Sprite):
     """The main character - Chain"""
     
+    # Fields snapshotted for introspection metadata each time Chain is drawn
+    INTROSPECT_FIELDS = (("state", "sprite_state"), "mode", "facing_right", "health", "magic")
+    INVINCIBLE_INTROSPECT_FIELDS = (("state", "sprite_state"), "mode",
+                                    ("invincible", "invincible_mode"), "health", "magic")
+    
     def __init__(self, x, y, mode='level'):
         super().__init__()
         self.mode = mode  # 'level' for side-scroller, 'world' for top-down
@@ -64,16 +67,28 @@ class Player(pygame.sprite.Sprite):
     def update_sprite(self):
         """Update the current sprite based on state"""
         if self.mode == 'world':
-            self.image = create_chain_world_sprite(self.facing, self.frame)
+            self.image = get_sprite('chain', 'world', self.facing, self.frame)
         elif self.is_attacking:
             if self.is_up_attack:
-                self.image = create_chain_up_attack_sprite(self.facing_right)
+                pose = 'attack_up'
             elif self.is_down_attack:
-                self.image = create_chain_down_attack_sprite(self.facing_right)
+                pose = 'attack_down'
             else:
-                self.image = create_chain_attack_sprite(self.facing_right)
+                pose = 'attack'
+            self.image = get_sprite('chain', pose, self.facing_right)
         else:
-            self.image = create_chain_sprite(self.facing_right, self.frame)
+            self.image = get_sprite('chain', 'walk', self.facing_right, self.frame)
+    
+    @property
+    def sprite_state(self):
+        """Name of the current sprite state (for introspection)"""
+        if self.is_attacking:
+            if self.is_up_attack:
+                return "up_attack"
+            if self.is_down_attack:
+                return "down_attack"
+            return "attack"
+        return "idle"
     
     def handle_input(self, keys, events):
         """Handle player input"""
@@ -191,12 +206,16 @@ class Player(pygame.sprite.Sprite):
         self.update_sprite()
     
     def update_level_physics(self, tiles):
-        """Update physics for side-scroller mode"""
+        """Update physics for side-scroller mode (tiles is the level's TileMap)"""
         # Apply gravity
         self.velocity_y += PLAYER_GRAVITY
         if self.velocity_y > 15:  # Terminal velocity
             self.velocity_y = 15
         
+        # Only tiles along this frame's move can collide
+        if tiles:
+            tiles = tiles.query(self.rect, self.velocity_x, self.velocity_y)
+        
         # Move horizontally
         self.rect.x += self.velocity_x
         
@@ -336,22 +355,9 @@ class Player(pygame.sprite.Sprite):
         if self.is_hurt and self.frame % 4 < 2:
             return  # Don't draw (flashing effect)
         
-        # Determine sprite state for introspection metadata
-        sprite_state = "idle"
-        if self.is_attacking:
-            if self.is_up_attack:
-                sprite_state = "up_attack"
-            elif self.is_down_attack:
-                sprite_state = "down_attack"
-            else:
-                sprite_state = "attack"
-        
         # Rainbow shimmer effect when in invincible mode
         if self.invincible_mode:
             self.invincible_frame += 1
-            # Create rainbow-tinted copy of sprite
-            rainbow_img = self.image.copy()
-            
             # Cycle through rainbow colors
             hue = (self.invincible_frame * 8) % 360
             # Convert hue to RGB (simplified rainbow)
@@ -368,20 +374,18 @@ class Player(pygame.sprite.Sprite):
             else:
                 r, g, b = 255, 0, int((360 - hue) * 4.25)
             
-            # Apply rainbow tint
-            rainbow_img.fill((r, g, b, 100), special_flags=pygame.BLEND_RGBA_ADD)
+            # Apply rainbow tint (a palette swap on an 8-bit copy)
+            rainbow_img = indexed_sprite(self.image).tint((r, g, b))
             
             # Draw with glow effect
-            glow_surface = pygame.Surface((rainbow_img.get_width() + 8, rainbow_img.get_height() + 8), pygame.SRCALPHA)
-            glow_surface.fill((r, g, b, 50))
+            w, h = rainbow_img.get_size()
+            glow_surface = solid_sprite((w + 8, h + 8), (r, g, b, 50))
             surface.blit(glow_surface, (draw_x - 4, draw_y - 4))
             introspect.draw(surface, rainbow_img, (draw_x, draw_y), "player_chain",
-                           {"state": sprite_state, "mode": self.mode, "invincible": True,
-                            "health": self.health, "magic": self.magic})
+                           self.INVINCIBLE_INTROSPECT_FIELDS, owner=self)
         else:
             introspect.draw(surface, self.image, (draw_x, draw_y), "player_chain",
-                           {"state": sprite_state, "mode": self.mode, "facing_right": self.facing_right,
-                            "health": self.health, "magic": self.magic})
+                           self.INTROSPECT_FIELDS, owner=self)
         
         # Draw spell effects
         player_center = (
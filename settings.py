@@ -8,6 +8,7 @@ SCREEN_HEIGHT = 600
 FPS = 60
 TILE_SIZE = 32
 PIXEL_SCALE = 2  # For that chunky 16-bit look
+PRERENDER_TERRAIN = True  # Draw level terrain from pre-rendered chunks, not tile by tile
 
 # Game title
 TITLE = "Chain - Quest for the Lost Princess"
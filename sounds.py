@@ -6,6 +6,7 @@ Uses procedurally generated sounds and music
 import pygame
 import math
 import array
+from functools import partial
 
 
 def init_sound():
@@ -274,7 +275,7 @@ def generate_chiptune_track(melody, bass, tempo=120, volume=0.2):
 class SoundManager:
     """Manages all game sounds and music"""
     
-    def __init__(self):
+    def __init__(self, generate=True):
         init_sound()
         
         self.sounds = {}
@@ -283,31 +284,39 @@ class SoundManager:
         self.music_enabled = True
         self.sound_enabled = True
         
-        self._generate_sounds()
-        self._generate_music()
+        # Without generate, the caller fills sounds/music from the recipes
+        # (see loader.AssetLoader)
+        if generate:
+            for name, make in self.sound_recipes().items():
+                self.sounds[name] = make()
+            for name, make in self.music_recipes().items():
+                self.music[name] = make()
     
-    def _generate_sounds(self):
-        """Generate all sound effects"""
+    def sound_recipes(self):
+        """Sound effect name -> zero-argument function that generates it"""
+        recipes = {}
+        
         # Attack sound
-        self.sounds['attack'] = generate_square_wave(200, 0.1, 0.2)
+        recipes['attack'] = partial(generate_square_wave, 200, 0.1, 0.2)
         
         # Jump sound
-        self.sounds['jump'] = self._make_jump_sound()
+        recipes['jump'] = self._make_jump_sound
         
         # Hit sound
-        self.sounds['hit'] = generate_noise(0.15, 0.3)
+        recipes['hit'] = partial(generate_noise, 0.15, 0.3)
         
         # Pickup sound
-        self.sounds['pickup'] = self._make_pickup_sound()
+        recipes['pickup'] = self._make_pickup_sound
         
         # Spell sounds
-        self.sounds['spell'] = generate_square_wave(440, 0.2, 0.2)
+        recipes['spell'] = partial(generate_square_wave, 440, 0.2, 0.2)
         
         # Enemy death
-        self.sounds['enemy_death'] = self._make_death_sound()
+        recipes['enemy_death'] = self._make_death_sound
         
         # Menu select
-        self.sounds['menu'] = generate_square_wave(330, 0.1, 0.15)
+        recipes['menu'] = partial(generate_square_wave, 330, 0.1, 0.15)
+        return recipes
     
     def _make_jump_sound(self):
         """Create a jump sound effect (rising pitch)"""
@@ -393,8 +402,9 @@ class SoundManager:
         
         return pygame.mixer.Sound(buffer=stereo_buf)
     
-    def _generate_music(self):
-        """Generate background music tracks with harmony and rhythm"""
+    def music_recipes(self):
+        """Music track name -> zero-argument function that generates it"""
+        recipes = {}
         
         # Menu music - calm, mysterious with arpeggios
         menu_melody = [
@@ -413,7 +423,7 @@ class SoundManager:
             ('A2', 4), ('E2', 4),
             ('A2', 2), ('REST', 4),
         ]
-        self.music['menu'] = generate_chiptune_track(menu_melody, menu_bass, tempo=85, volume=0.18)
+        recipes['menu'] = partial(generate_chiptune_track, menu_melody, menu_bass, tempo=85, volume=0.18)
         
         # World map music - adventurous with bouncy rhythm
         world_melody = [
@@ -436,7 +446,7 @@ class SoundManager:
             ('G2', 2), ('C3', 2),
             ('C3', 4),
         ]
-        self.music['world'] = generate_chiptune_track(world_melody, world_bass, tempo=120, volume=0.18)
+        recipes['world'] = partial(generate_chiptune_track, world_melody, world_bass, tempo=120, volume=0.18)
         
         # Level music - energetic action with driving beat
         level_melody = [
@@ -457,7 +467,7 @@ class SoundManager:
             ('C3', 0.5), ('G2', 0.5), ('A2', 0.5), ('F2', 0.5),
             ('G2', 1), ('C3', 1),
         ]
-        self.music['level'] = generate_chiptune_track(level_melody, level_bass, tempo=115, volume=0.2)
+        recipes['level'] = partial(generate_chiptune_track, level_melody, level_bass, tempo=115, volume=0.2)
         
         # Boss music - intense and aggressive
         boss_melody = [
@@ -488,7 +498,8 @@ class SoundManager:
             ('A2', 1), ('E2', 1),
             ('E2', 1), ('E2', 1),
         ]
-        self.music['boss'] = generate_chiptune_track(boss_melody, boss_bass, tempo=170, volume=0.22)
+        recipes['boss'] = partial(generate_chiptune_track, boss_melody, boss_bass, tempo=170, volume=0.22)
+        return recipes
     
     def play_sound(self, sound_name):
         """Play a sound effect"""
@@ -533,9 +544,9 @@ class SoundManager:
 _sound_manager = None
 
 
-def get_sound_manager():
+def get_sound_manager(generate=True):
     """Get the global sound manager"""
     global _sound_manager
     if _sound_manager is None:
-        _sound_manager = SoundManager()
+        _sound_manager = SoundManager(generate)
     return _sound_manager
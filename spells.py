@@ -5,7 +5,7 @@ Spell system for Chain
 import pygame
 import math
 from settings import *
-from sprites import create_fireball_sprite, create_thunder_sprite, create_shield_effect_sprite
+from animation import get_animation
 from introspection import introspect
 
 
@@ -61,7 +61,7 @@ class ShieldSpell(Spell):
     
     def draw(self, surface, pos):
         if self.active:
-            sprite = create_shield_effect_sprite(self.frame)
+            sprite = get_animation('shield').frame_at(self.frame)
             # Center on player
             x = pos[0] - sprite.get_width() // 2
             y = pos[1] - sprite.get_height() // 2
@@ -148,7 +148,8 @@ class Fireball(pygame.sprite.Sprite):
     def __init__(self, x, y, facing_right):
         super().__init__()
         self.frame = 0
-        self.image = create_fireball_sprite(self.frame)
+        self.animation = get_animation('fireball')
+        self.image = self.animation.frame_at(self.frame)
         self.rect = self.image.get_rect(center=(x, y))
         self.direction = 1 if facing_right else -1
         self.speed = FIREBALL_SPEED
@@ -158,7 +159,7 @@ class Fireball(pygame.sprite.Sprite):
     def update(self):
         self.frame += 1
         self.rect.x += self.speed * self.direction
-        self.image = create_fireball_sprite(self.frame)
+        self.image = self.animation.frame_at(self.frame)
         self.lifetime -= 1
         
         if self.lifetime <= 0:
@@ -195,7 +196,8 @@ class ThunderEffect(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
         self.frame = 0
-        self.image = create_thunder_sprite(self.frame)
+        self.animation = get_animation('thunder')
+        self.image = self.animation.frame_at(self.frame)
         self.rect = self.image.get_rect(center=(x, y))
         self.damage = THUNDER_DAMAGE
         self.radius = THUNDER_RADIUS
@@ -204,7 +206,7 @@ class ThunderEffect(pygame.sprite.Sprite):
     
     def update(self):
         self.frame += 1
-        self.image = create_thunder_sprite(self.frame)
+        self.image = self.animation.frame_at(self.frame)
         self.lifetime -= 1
         
         if self.lifetime <= 0:
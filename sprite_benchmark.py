@@ -0,0 +1,180 @@
+"""
+Sprite generation benchmark for Chain
+
+Times every sprite factory in sprites.py (create_tile_sprite and
+create_world_map_tile once per tile type) in two modes:
+
+    cold    cache cleared before every call: spec, rasterize, finalize
+    cached  repeated calls served by the sprite cache
+
+and records ops/sec plus the Python heap bytes allocated per call (peak,
+from tracemalloc; SDL pixel buffers are not included). Results are JSON,
+so runs can be diffed to catch regressions in the art pipeline.
+
+Usage:
+    python sprite_benchmark.py [-o results.json] [--min-time SECONDS]
+    python sprite_benchmark.py --compare base.json new.json [--threshold PERCENT]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from settings import *
+import sprites
+from sprites import sprite_cache
+from atlas import TILE_VARIANTS, WORLD_TILE_TYPES
+
+MODES = ('cold', 'cached')
+
+
+def benchmark_cases():
+    """Yield (case name, factory, args) for every sprite factory."""
+    for name in sorted(vars(sprites)):
+        factory = getattr(sprites, name)
+        if not name.startswith('create_') or not hasattr(factory, 'render'):
+            continue
+        if name == 'create_tile_sprite':
+            for tile_type in TILE_VARIANTS:
+                yield f'{name}[{tile_type}]', factory, (tile_type,)
+        elif name == 'create_world_map_tile':
+            for tile_type in WORLD_TILE_TYPES:
+                yield f'{name}[{tile_type}]', factory, (tile_type,)
+        else:
+            yield name, factory, ()
+
+
+def call_for(mode, factory, args):
+    """A zero-argument call exercising factory in the given mode."""
+    if mode == 'cold':
+        def call():
+            sprite_cache.clear()
+            return factory(*args)
+    else:
+        factory(*args)  # Warm the cache
+        def call():
+            return factory(*args)
+    return call
+
+
+def ops_per_second(call, min_time, repeats=3):
+    """Best rate over a few runs of at least min_time seconds each."""
+    best = 0.0
+    for _ in range(repeats):
+        calls = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            for _ in range(10):
+                call()
+            calls += 10
+            elapsed = time.perf_counter() - start
+        best = max(best, calls / elapsed)
+    return best
+
+
+def alloc_bytes_per_call(call, calls=20):
+    """Mean peak Python heap growth of a single call."""
+    call()
+    tracemalloc.start()
+    total = 0
+    for _ in range(calls):
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        call()
+        total += tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    return total / calls
+
+
+def run(min_time=0.1):
+    """Benchmark every case in every mode; returns the JSON-ready results."""
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    results = {}
+    for case, factory, args in benchmark_cases():
+        results[case] = {}
+        for mode in MODES:
+            call = call_for(mode, factory, args)
+            results[case][mode] = {
+                'ops_per_sec': round(ops_per_second(call, min_time), 1),
+                'alloc_bytes': round(alloc_bytes_per_call(call), 1),
+            }
+        sprite_cache.clear()
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'video_driver': pygame.display.get_driver(),
+            'pixel_scale': PIXEL_SCALE,
+            'min_time': min_time,
+        },
+        'results': results,
+    }
+
+
+def compare(base, new, threshold=10.0):
+    """
+    Print per-case changes between two result files. Returns the cases
+    whose ops/sec dropped by more than threshold percent.
+    """
+    regressions = []
+    print(f"{'case':40s} {'mode':6s} {'ops/sec':>22s} {'change':>8s} {'alloc bytes':>20s}")
+    for case in sorted(set(base['results']) | set(new['results'])):
+        if case not in base['results'] or case not in new['results']:
+            where = 'new' if case in new['results'] else 'base'
+            print(f"{case:40s} only in {where}")
+            continue
+        for mode in MODES:
+            old = base['results'][case][mode]
+            cur = new['results'][case][mode]
+            change = (cur['ops_per_sec'] / old['ops_per_sec'] - 1) * 100
+            flag = ''
+            if change < -threshold:
+                flag = '  <-- slower'
+                regressions.append((case, mode))
+            print(f"{case:40s} {mode:6s} {old['ops_per_sec']:10,.0f} -> {cur['ops_per_sec']:9,.0f} "
+                  f"{change:+7.1f}% {old['alloc_bytes']:8,.0f} -> {cur['alloc_bytes']:9,.0f}{flag}")
+
+    print(f"\n{len(regressions)} regression(s) beyond {threshold:g}%")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Chain's sprite factories")
+    parser.add_argument('-o', '--output', help="write results to this JSON file (default: stdout)")
+    parser.add_argument('--min-time', type=float, default=0.1,
+                        help="seconds to time each case and mode for (default: 0.1)")
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'),
+                        help="diff two result files instead of benchmarking")
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help="ops/sec drop, in percent, reported as a regression (default: 10)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            base = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+        return 1 if compare(base, new, args.threshold) else 0
+
+    output = json.dumps(run(args.min_time), indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,103 +2,435 @@
 Sprite rendering utilities for 16-bit pixel art style
 """
 
+import functools
+import weakref
+from collections import OrderedDict
+from typing import NamedTuple
+
 import pygame
 from settings import *
 
 
-def create_pixel_surface(width, height, scale=PIXEL_SCALE):
-    """Create a surface for pixel art that will be scaled up"""
-    return pygame.Surface((width, height), pygame.SRCALPHA)
+# Most sprites this module draws are requested again every frame; keep the
+# most recently used ones around instead of redrawing them
+SPRITE_CACHE_SIZE = 512
+
+# Transparent colour for colour-keyed sprites (not part of the palette)
+SPRITE_COLORKEY = (255, 0, 255)
+
+
+class SpriteCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+    maxsize: int
+
+
+class SpriteCache:
+    """
+    Bounded LRU cache of generated sprite surfaces.
+    
+    Pinned sprites (e.g. those packed into the atlas) are never evicted.
+    """
+    
+    def __init__(self, maxsize=SPRITE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.pinned = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        surface = self.pinned.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        surface = self.entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return surface
+    
+    def pin(self, key, surface):
+        self.pinned[key] = surface
+        self.entries.pop(key, None)
+    
+    def put(self, key, surface):
+        self.entries[key] = surface
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+    
+    def info(self):
+        return SpriteCacheInfo(self.hits, self.misses,
+                               len(self.entries) + len(self.pinned), self.maxsize)
+    
+    def clear(self):
+        self.entries.clear()
+        self.pinned.clear()
+        self.hits = self.misses = 0
+
+
+sprite_cache = SpriteCache()
+
+
+def cached_sprite(normalize, mirror=False):
+    """
+    Cache a sprite factory's rasterized results in sprite_cache.
+    
+    The factory returns a PixelSpec. normalize takes the factory's
+    arguments and returns the canonical positional arguments that fully
+    determine the sprite (e.g. frame % 2 for a two-frame walk cycle). It is
+    the cache key, and the factory is called with it on a miss. Cached
+    surfaces are shared, so callers must not draw on them.
+    
+    With mirror=True the first canonical argument is facing_right: the
+    factory only ever draws the right-facing pose, and left-facing sprites
+    are a flip of the cached right-facing one.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__,) + normalize(*args, **kwargs)
+            surface = sprite_cache.get(key)
+            if surface is None:
+                if mirror and not key[1]:
+                    surface = mirror_surface(wrapper(True, *key[2:]))
+                else:
+                    surface = finalize_surface(rasterize(func(*key[1:])))
+                sprite_cache.put(key, surface)
+            return surface
+    
+        def spec(*args):
+            """The PixelSpec for canonical arguments."""
+            if mirror and not args[0]:
+                return func(True, *args[1:]).mirrored()
+            return func(*args)
+        
+        def render(*args):
+            """Draw a sprite from canonical arguments, bypassing the cache."""
+            return rasterize(spec(*args))
+    
+        wrapper.spec = spec
+        wrapper.render = render
+        wrapper.normalize = normalize
+        return wrapper
+    return decorator
+
+
+def mirror_surface(surface):
+    """Horizontally flipped copy of a sprite, keeping its colour key."""
+    flipped = pygame.transform.flip(surface, True, False)
+    colorkey = surface.get_colorkey()
+    if colorkey is not None:
+        flipped.set_colorkey(colorkey, pygame.RLEACCEL)
+    return flipped
+
+
+def has_hard_alpha(surface):
+    """True if every pixel is either fully opaque or fully transparent."""
+    return (pygame.mask.from_surface(surface, 0).count() ==
+            pygame.mask.from_surface(surface, 254).count())
+
+
+def finalize_surface(surface, rle=True):
+    """
+    Convert a generated sprite to the display's pixel format, so blits
+    don't convert it again on every call.
+    
+    Hard-edged sprites (all of ours) become colour-keyed, RLE accelerated
+    surfaces; anything with soft alpha keeps per-pixel alpha. Before the
+    display exists the surface is returned unchanged. The result must not
+    be drawn on.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if not has_hard_alpha(surface):
+        return surface.convert_alpha()
+    converted = pygame.Surface(surface.get_size()).convert()
+    converted.fill(SPRITE_COLORKEY)
+    converted.blit(surface, (0, 0))
+    converted.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL if rle else 0)
+    return converted
+
+
+class IndexedSprite:
+    """
+    8-bit palettized copy of a sprite.
+    
+    Palette index 0 is the transparent colour key; every other colour the
+    sprite uses gets its own index, so recolouring the whole sprite is a
+    palette swap instead of a pass over its pixels.
+    """
+    
+    def __init__(self, surface):
+        w, h = surface.get_size()
+        
+        # Composite onto per-pixel alpha so colour-keyed sprites read back
+        # their transparent pixels as alpha 0
+        rgba = pygame.Surface((w, h), pygame.SRCALPHA)
+        rgba.blit(surface, (0, 0))
+        pixels = pygame.image.tobytes(rgba, 'RGBA')
+        
+        self.palette = [SPRITE_COLORKEY]
+        index_of = {}
+        indices = bytearray(w * h)
+        for i in range(w * h):
+            pixel = pixels[i * 4:i * 4 + 4]
+            if pixel[3] == 0:
+                continue
+            rgb = pixel[:3]
+            index = index_of.get(rgb)
+            if index is None:
+                index = index_of[rgb] = len(self.palette)
+                self.palette.append(tuple(rgb))
+            indices[i] = index
+        
+        self.surface = pygame.image.frombytes(bytes(indices), (w, h), 'P')
+        self.surface.set_palette(self.palette)
+        self.surface.set_colorkey(0)
+    
+    def tint(self, rgb):
+        """
+        Add rgb to every colour (like a BLEND_ADD fill) by swapping the
+        palette, and return the recoloured surface.
+        """
+        r, g, b = rgb
+        self.surface.set_palette([self.palette[0]] + [
+            (min(255, pr + r), min(255, pg + g), min(255, pb + b))
+            for pr, pg, pb in self.palette[1:]])
+        return self.surface
+
+
+_indexed_sprites = weakref.WeakKeyDictionary()
+_tinted_sprites = {}
+_solid_sprites = {}
+
+
+def indexed_sprite(surface):
+    """The (cached) IndexedSprite for a sprite surface, for per-frame tints."""
+    indexed = _indexed_sprites.get(surface)
+    if indexed is None:
+        indexed = _indexed_sprites[surface] = IndexedSprite(surface)
+    return indexed
+
+
+def tinted_sprite(surface, rgb):
+    """A fixed, cached recolouring of a sprite (see IndexedSprite.tint)."""
+    key = (surface, tuple(rgb))
+    tinted = _tinted_sprites.get(key)
+    if tinted is None:
+        tinted = _tinted_sprites[key] = IndexedSprite(surface).tint(rgb)
+    return tinted
+
+
+def solid_sprite(size, color):
+    """
+    A single-colour rectangle, with color's alpha (if any) as surface alpha.
+    
+    There is one 8-bit surface per size, recoloured through its palette on
+    each call, so use the result before asking for another colour.
+    """
+    solid = _solid_sprites.get(size)
+    if solid is None:
+        solid = _solid_sprites[size] = pygame.Surface(size, 0, 8)
+        solid.fill(0)
+    solid.set_palette_at(0, color[:3])
+    solid.set_alpha(color[3] if len(color) > 3 else None)
+    return solid
+
+
+def sprite_cache_info():
+    """Hit/miss counters and size of the sprite cache."""
+    return sprite_cache.info()
+
+
+def _cycle(period, hold=1):
+    """Normalize an animation frame counter to the first frame of its pose."""
+    return lambda frame: frame % period // hold * hold
+
+
+def _tile_key(tile_type, variant=0):
+    """Only the variant bits a tile type actually draws with matter."""
+    if tile_type == 'grass':
+        variant %= 4
+    elif tile_type == 'water':
+        variant %= 8
+    elif tile_type == 'sky':
+        variant = 0 if variant % 3 == 0 else 1
+    else:
+        variant = 0
+    return (tile_type, variant)
+
+
+_walk_frame = _cycle(2)
+_slime_frame = _cycle(20, 10)
+_bat_frame = _cycle(10, 5)
+_cannon_frame = _cycle(30, 15)
+_flicker_frame = _cycle(4, 2)
+_shield_frame = _cycle(10)
+_world_walk_frame = _cycle(20, 10)
+
+
+class PixelSpec:
+    """
+    Declarative pixel art at 1x: a size plus a list of (colour, rect)
+    layers painted in order, later layers on top.
+    
+    The sprite factories below build one of these instead of drawing;
+    rasterize() turns specs into upscaled surfaces.
+    """
+    
+    __slots__ = ('width', 'height', 'rects')
+    
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.rects = []
+    
+    def rect(self, color, rect):
+        """Paint a solid rectangle (x, y, w, h)."""
+        self.rects.append((color, tuple(rect)))
+    
+    def grid(self, rows, palette, x=0, y=0):
+        """
+        Paint character art: one string per row, each character a key of
+        palette. Characters not in palette (e.g. '.') are left untouched.
+        """
+        for row_y, row in enumerate(rows, y):
+            start = 0
+            while start < len(row):
+                end = start
+                while end < len(row) and row[end] == row[start]:
+                    end += 1
+                if row[start] in palette:
+                    self.rect(palette[row[start]], (x + start, row_y, end - start, 1))
+                start = end
+    
+    def mirrored(self):
+        """Horizontally flipped copy."""
+        flipped = PixelSpec(self.width, self.height)
+        flipped.rects = [(color, (self.width - x - w, y, w, h))
+                         for color, (x, y, w, h) in self.rects]
+        return flipped
+    
+    def draw(self, surface, x=0, y=0):
+        """Paint the spec at 1x onto a surface with pygame.draw."""
+        clip = surface.get_clip()
+        surface.set_clip(pygame.Rect(x, y, self.width, self.height).clip(clip))
+        for color, (rx, ry, w, h) in self.rects:
+            pygame.draw.rect(surface, color, (x + rx, y + ry, w, h))
+        surface.set_clip(clip)
+
+
+def rasterize_sheet(specs, positions, size, scale=PIXEL_SCALE):
+    """
+    Rasterize many specs into one surface in a single pass: every rect is
+    painted at 1x into one sheet, which is then upscaled once. positions
+    are 1x offsets into the sheet and size is its 1x size.
+    """
+    sheet = pygame.Surface(size, pygame.SRCALPHA)
+    for spec, (x, y) in zip(specs, positions):
+        spec.draw(sheet, x, y)
+    return scale_surface(sheet, scale)
 
 
+def rasterize(spec, scale=PIXEL_SCALE):
+    """Rasterize a single spec to an upscaled SRCALPHA surface."""
+    return rasterize_sheet([spec], [(0, 0)], (spec.width, spec.height), scale)
+
+
+@cached_sprite(lambda facing_right=True: (bool(facing_right),), mirror=True)
 def create_chain_up_attack_sprite(facing_right=True):
     """Create Chain's up-slash attack sprite"""
     size = 24
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     offset_x = 4
     
     # Body
     body_color = TEAL
-    pygame.draw.rect(surface, body_color, (offset_x + 4, 10, 8, 7))
+    spec.rect(body_color, (offset_x + 4, 10, 8, 7))
     
     # Head (looking up slightly)
     skin_color = BEIGE
-    pygame.draw.rect(surface, skin_color, (offset_x + 5, 6, 6, 5))
+    spec.rect(skin_color, (offset_x + 5, 6, 6, 5))
     
     # Hair
     hair_color = NAVY
-    pygame.draw.rect(surface, hair_color, (offset_x + 5, 5, 6, 2))
+    spec.rect(hair_color, (offset_x + 5, 5, 6, 2))
     
     # Eyes (looking up)
     eye_color = DARK_BLUE
-    pygame.draw.rect(surface, eye_color, (offset_x + 6, 7, 1, 1))
-    pygame.draw.rect(surface, eye_color, (offset_x + 9, 7, 1, 1))
+    spec.rect(eye_color, (offset_x + 6, 7, 1, 1))
+    spec.rect(eye_color, (offset_x + 9, 7, 1, 1))
     
     # Legs
     leg_color = BROWN
-    pygame.draw.rect(surface, leg_color, (offset_x + 5, 17, 2, 3))
-    pygame.draw.rect(surface, leg_color, (offset_x + 9, 17, 2, 3))
+    spec.rect(leg_color, (offset_x + 5, 17, 2, 3))
+    spec.rect(leg_color, (offset_x + 9, 17, 2, 3))
     
     # Arms raised up
-    pygame.draw.rect(surface, skin_color, (offset_x + 3, 8, 2, 4))
-    pygame.draw.rect(surface, skin_color, (offset_x + 11, 8, 2, 4))
+    spec.rect(skin_color, (offset_x + 3, 8, 2, 4))
+    spec.rect(skin_color, (offset_x + 11, 8, 2, 4))
     
     # Sword pointing up
     sword_color = LIGHT_SLATE
     sword_handle = BROWN
-    pygame.draw.rect(surface, sword_handle, (offset_x + 6, 4, 4, 3))
-    pygame.draw.rect(surface, sword_color, (offset_x + 7, 0, 2, 5))
-    pygame.draw.rect(surface, YELLOW, (offset_x + 5, 3, 6, 1))  # Guard
+    spec.rect(sword_handle, (offset_x + 6, 4, 4, 3))
+    spec.rect(sword_color, (offset_x + 7, 0, 2, 5))
+    spec.rect(YELLOW, (offset_x + 5, 3, 6, 1))  # Guard
     
     # Slash effect
-    pygame.draw.rect(surface, WHITE, (offset_x + 4, 0, 1, 4))
-    pygame.draw.rect(surface, WHITE, (offset_x + 11, 0, 1, 4))
+    spec.rect(WHITE, (offset_x + 4, 0, 1, 4))
+    spec.rect(WHITE, (offset_x + 11, 0, 1, 4))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda facing_right=True: (bool(facing_right),), mirror=True)
 def create_chain_down_attack_sprite(facing_right=True):
     """Create Chain's downward stab attack sprite"""
     size = 24
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     offset_x = 4
     
     # Body (crouched/diving position)
     body_color = TEAL
-    pygame.draw.rect(surface, body_color, (offset_x + 4, 2, 8, 7))
+    spec.rect(body_color, (offset_x + 4, 2, 8, 7))
     
     # Head (looking down)
     skin_color = BEIGE
-    pygame.draw.rect(surface, skin_color, (offset_x + 5, 0, 6, 4))
+    spec.rect(skin_color, (offset_x + 5, 0, 6, 4))
     
     # Hair
     hair_color = NAVY
-    pygame.draw.rect(surface, hair_color, (offset_x + 5, 0, 6, 2))
+    spec.rect(hair_color, (offset_x + 5, 0, 6, 2))
     
     # Legs tucked
     leg_color = BROWN
-    pygame.draw.rect(surface, leg_color, (offset_x + 4, 9, 3, 3))
-    pygame.draw.rect(surface, leg_color, (offset_x + 9, 9, 3, 3))
+    spec.rect(leg_color, (offset_x + 4, 9, 3, 3))
+    spec.rect(leg_color, (offset_x + 9, 9, 3, 3))
     
     # Arms pointing down
-    pygame.draw.rect(surface, skin_color, (offset_x + 6, 8, 2, 3))
-    pygame.draw.rect(surface, skin_color, (offset_x + 8, 8, 2, 3))
+    spec.rect(skin_color, (offset_x + 6, 8, 2, 3))
+    spec.rect(skin_color, (offset_x + 8, 8, 2, 3))
     
     # Sword pointing down
     sword_color = LIGHT_SLATE
     sword_handle = BROWN
-    pygame.draw.rect(surface, sword_handle, (offset_x + 6, 11, 4, 2))
-    pygame.draw.rect(surface, sword_color, (offset_x + 7, 13, 2, 8))
-    pygame.draw.rect(surface, YELLOW, (offset_x + 5, 12, 6, 1))  # Guard
+    spec.rect(sword_handle, (offset_x + 6, 11, 4, 2))
+    spec.rect(sword_color, (offset_x + 7, 13, 2, 8))
+    spec.rect(YELLOW, (offset_x + 5, 12, 6, 1))  # Guard
     
     # Stab effect
-    pygame.draw.rect(surface, WHITE, (offset_x + 6, 18, 1, 3))
-    pygame.draw.rect(surface, WHITE, (offset_x + 9, 18, 1, 3))
-    pygame.draw.rect(surface, YELLOW, (offset_x + 7, 20, 2, 2))
+    spec.rect(WHITE, (offset_x + 6, 18, 1, 3))
+    spec.rect(WHITE, (offset_x + 9, 18, 1, 3))
+    spec.rect(YELLOW, (offset_x + 7, 20, 2, 2))
     
-    return scale_surface(surface)
+    return spec
 
 
 def scale_surface(surface, scale=PIXEL_SCALE):
@@ -107,290 +439,263 @@ def scale_surface(surface, scale=PIXEL_SCALE):
     return pygame.transform.scale(surface, (w * scale, h * scale))
 
 
-def draw_pixel_rect(surface, color, rect, scale=1):
-    """Draw a rectangle with pixel-perfect edges"""
-    pygame.draw.rect(surface, color, rect)
-
-
+@cached_sprite(lambda facing_right=True, frame=0: (bool(facing_right), _walk_frame(frame)),
+               mirror=True)
 def create_chain_sprite(facing_right=True, frame=0):
-    """Create Chain's sprite - the hero"""
+    """Create Chain's sprite - the hero (drawn facing right, mirrored by the cache)"""
     size = 16
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     # Body (tunic)
     body_color = TEAL
-    pygame.draw.rect(surface, body_color, (4, 6, 8, 7))
+    spec.rect(body_color, (4, 6, 8, 7))
     
     # Head
     skin_color = BEIGE
-    pygame.draw.rect(surface, skin_color, (5, 2, 6, 5))
+    spec.rect(skin_color, (5, 2, 6, 5))
     
     # Hair (blue-ish)
     hair_color = NAVY
-    pygame.draw.rect(surface, hair_color, (5, 1, 6, 2))
-    pygame.draw.rect(surface, hair_color, (4, 2, 1, 2))
-    if facing_right:
-        pygame.draw.rect(surface, hair_color, (11, 2, 1, 3))
-    else:
-        pygame.draw.rect(surface, hair_color, (4, 2, 1, 3))
+    spec.rect(hair_color, (5, 1, 6, 2))
+    spec.rect(hair_color, (4, 2, 1, 2))
+    spec.rect(hair_color, (11, 2, 1, 3))
     
     # Eyes
     eye_color = DARK_BLUE
-    if facing_right:
-        pygame.draw.rect(surface, eye_color, (9, 4, 1, 1))
-    else:
-        pygame.draw.rect(surface, eye_color, (6, 4, 1, 1))
-    
+    spec.rect(eye_color, (9, 4, 1, 1))
+
     # Legs (animated)
     leg_color = BROWN
     if frame % 2 == 0:
-        pygame.draw.rect(surface, leg_color, (5, 13, 2, 3))
-        pygame.draw.rect(surface, leg_color, (9, 13, 2, 3))
+        spec.rect(leg_color, (5, 13, 2, 3))
+        spec.rect(leg_color, (9, 13, 2, 3))
     else:
-        pygame.draw.rect(surface, leg_color, (4, 13, 2, 3))
-        pygame.draw.rect(surface, leg_color, (10, 13, 2, 3))
+        spec.rect(leg_color, (4, 13, 2, 3))
+        spec.rect(leg_color, (10, 13, 2, 3))
     
     # Boots
     boot_color = DARK_BROWN
     if frame % 2 == 0:
-        pygame.draw.rect(surface, boot_color, (5, 15, 2, 1))
-        pygame.draw.rect(surface, boot_color, (9, 15, 2, 1))
+        spec.rect(boot_color, (5, 15, 2, 1))
+        spec.rect(boot_color, (9, 15, 2, 1))
     else:
-        pygame.draw.rect(surface, boot_color, (4, 15, 2, 1))
-        pygame.draw.rect(surface, boot_color, (10, 15, 2, 1))
+        spec.rect(boot_color, (4, 15, 2, 1))
+        spec.rect(boot_color, (10, 15, 2, 1))
     
     # Belt
     belt_color = BROWN
-    pygame.draw.rect(surface, belt_color, (4, 10, 8, 1))
+    spec.rect(belt_color, (4, 10, 8, 1))
     
     # Belt buckle (chain link symbol)
-    pygame.draw.rect(surface, YELLOW, (7, 10, 2, 1))
-    
-    if not facing_right:
-        surface = pygame.transform.flip(surface, True, False)
+    spec.rect(YELLOW, (7, 10, 2, 1))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda facing_right=True: (bool(facing_right),), mirror=True)
 def create_chain_attack_sprite(facing_right=True):
-    """Create Chain's attack sprite with sword"""
+    """Create Chain's attack sprite with sword (drawn facing right, mirrored by the cache)"""
     size = 24
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     # Base character (offset to make room for sword)
-    offset_x = 4 if facing_right else 4
-    
+    offset_x = 4
+
     # Body
     body_color = TEAL
-    pygame.draw.rect(surface, body_color, (offset_x + 4, 6, 8, 7))
+    spec.rect(body_color, (offset_x + 4, 6, 8, 7))
     
     # Head
     skin_color = BEIGE
-    pygame.draw.rect(surface, skin_color, (offset_x + 5, 2, 6, 5))
+    spec.rect(skin_color, (offset_x + 5, 2, 6, 5))
     
     # Hair
     hair_color = NAVY
-    pygame.draw.rect(surface, hair_color, (offset_x + 5, 1, 6, 2))
+    spec.rect(hair_color, (offset_x + 5, 1, 6, 2))
     
     # Eyes
     eye_color = DARK_BLUE
-    if facing_right:
-        pygame.draw.rect(surface, eye_color, (offset_x + 9, 4, 1, 1))
-    else:
-        pygame.draw.rect(surface, eye_color, (offset_x + 6, 4, 1, 1))
-    
+    spec.rect(eye_color, (offset_x + 9, 4, 1, 1))
+
     # Legs
     leg_color = BROWN
-    pygame.draw.rect(surface, leg_color, (offset_x + 5, 13, 2, 3))
-    pygame.draw.rect(surface, leg_color, (offset_x + 9, 13, 2, 3))
+    spec.rect(leg_color, (offset_x + 5, 13, 2, 3))
+    spec.rect(leg_color, (offset_x + 9, 13, 2, 3))
     
     # Sword
     sword_color = LIGHT_SLATE
     sword_handle = BROWN
-    if facing_right:
-        pygame.draw.rect(surface, sword_handle, (offset_x + 12, 6, 2, 3))
-        pygame.draw.rect(surface, sword_color, (offset_x + 14, 4, 6, 2))
-        pygame.draw.rect(surface, YELLOW, (offset_x + 12, 5, 3, 1))  # Guard
-    else:
-        pygame.draw.rect(surface, sword_handle, (offset_x - 2, 6, 2, 3))
-        pygame.draw.rect(surface, sword_color, (offset_x - 8, 4, 6, 2))
-        pygame.draw.rect(surface, YELLOW, (offset_x - 3, 5, 3, 1))  # Guard
+    spec.rect(sword_handle, (offset_x + 12, 6, 2, 3))
+    spec.rect(sword_color, (offset_x + 14, 4, 6, 2))
+    spec.rect(YELLOW, (offset_x + 12, 5, 3, 1))  # Guard
     
-    if not facing_right:
-        surface = pygame.transform.flip(surface, True, False)
-    
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda frame=0: (_slime_frame(frame),))
 def create_slime_sprite(frame=0):
     """Create slime enemy sprite"""
     size = 12
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     color = LIME
     dark = DARK_GREEN
     
     # Body (bouncy animation)
     if frame % 20 < 10:
-        pygame.draw.rect(surface, dark, (1, 6, 10, 6))
-        pygame.draw.rect(surface, color, (2, 4, 8, 6))
-        pygame.draw.rect(surface, color, (3, 3, 6, 2))
+        spec.rect(dark, (1, 6, 10, 6))
+        spec.rect(color, (2, 4, 8, 6))
+        spec.rect(color, (3, 3, 6, 2))
     else:
-        pygame.draw.rect(surface, dark, (0, 8, 12, 4))
-        pygame.draw.rect(surface, color, (1, 6, 10, 4))
-        pygame.draw.rect(surface, color, (2, 5, 8, 2))
+        spec.rect(dark, (0, 8, 12, 4))
+        spec.rect(color, (1, 6, 10, 4))
+        spec.rect(color, (2, 5, 8, 2))
     
     # Eyes
-    pygame.draw.rect(surface, WHITE, (3, 5, 2, 2))
-    pygame.draw.rect(surface, WHITE, (7, 5, 2, 2))
-    pygame.draw.rect(surface, BLACK, (4, 6, 1, 1))
-    pygame.draw.rect(surface, BLACK, (8, 6, 1, 1))
+    spec.rect(WHITE, (3, 5, 2, 2))
+    spec.rect(WHITE, (7, 5, 2, 2))
+    spec.rect(BLACK, (4, 6, 1, 1))
+    spec.rect(BLACK, (8, 6, 1, 1))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda frame=0: (_bat_frame(frame),))
 def create_bat_sprite(frame=0):
     """Create bat enemy sprite"""
     size = 14
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     color = PURPLE
     dark = DARK_BLUE
     
     # Body
-    pygame.draw.rect(surface, color, (5, 5, 4, 5))
-    pygame.draw.rect(surface, dark, (6, 4, 2, 2))
+    spec.rect(color, (5, 5, 4, 5))
+    spec.rect(dark, (6, 4, 2, 2))
     
     # Wings (animated)
     if frame % 10 < 5:
         # Wings up
-        pygame.draw.rect(surface, color, (0, 3, 5, 3))
-        pygame.draw.rect(surface, color, (9, 3, 5, 3))
-        pygame.draw.rect(surface, color, (1, 2, 3, 2))
-        pygame.draw.rect(surface, color, (10, 2, 3, 2))
+        spec.rect(color, (0, 3, 5, 3))
+        spec.rect(color, (9, 3, 5, 3))
+        spec.rect(color, (1, 2, 3, 2))
+        spec.rect(color, (10, 2, 3, 2))
     else:
         # Wings down
-        pygame.draw.rect(surface, color, (0, 6, 5, 3))
-        pygame.draw.rect(surface, color, (9, 6, 5, 3))
-        pygame.draw.rect(surface, color, (1, 8, 3, 2))
-        pygame.draw.rect(surface, color, (10, 8, 3, 2))
+        spec.rect(color, (0, 6, 5, 3))
+        spec.rect(color, (9, 6, 5, 3))
+        spec.rect(color, (1, 8, 3, 2))
+        spec.rect(color, (10, 8, 3, 2))
     
     # Eyes (red, menacing)
-    pygame.draw.rect(surface, RED, (5, 5, 1, 1))
-    pygame.draw.rect(surface, RED, (8, 5, 1, 1))
+    spec.rect(RED, (5, 5, 1, 1))
+    spec.rect(RED, (8, 5, 1, 1))
     
     # Ears
-    pygame.draw.rect(surface, color, (5, 3, 1, 2))
-    pygame.draw.rect(surface, color, (8, 3, 1, 2))
+    spec.rect(color, (5, 3, 1, 2))
+    spec.rect(color, (8, 3, 1, 2))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda facing_right=True, frame=0: (bool(facing_right), _walk_frame(frame)),
+               mirror=True)
 def create_knight_sprite(facing_right=True, frame=0):
-    """Create knight enemy sprite - armored and tough"""
+    """Create knight enemy sprite - armored and tough (drawn facing right, mirrored by the cache)"""
     size = 16
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     armor_color = SLATE
     armor_dark = GRAY
     visor_color = DARK_BLUE
     
     # Body (armor)
-    pygame.draw.rect(surface, armor_dark, (4, 6, 8, 7))
-    pygame.draw.rect(surface, armor_color, (5, 5, 6, 6))
+    spec.rect(armor_dark, (4, 6, 8, 7))
+    spec.rect(armor_color, (5, 5, 6, 6))
     
     # Helmet
-    pygame.draw.rect(surface, armor_dark, (4, 1, 8, 5))
-    pygame.draw.rect(surface, armor_color, (5, 2, 6, 3))
+    spec.rect(armor_dark, (4, 1, 8, 5))
+    spec.rect(armor_color, (5, 2, 6, 3))
     
     # Visor
-    pygame.draw.rect(surface, visor_color, (6, 3, 4, 2))
-    pygame.draw.rect(surface, RED, (7, 3, 1, 1))  # Glowing eye
-    pygame.draw.rect(surface, RED, (9, 3, 1, 1))  # Glowing eye
+    spec.rect(visor_color, (6, 3, 4, 2))
+    spec.rect(RED, (7, 3, 1, 1))  # Glowing eye
+    spec.rect(RED, (9, 3, 1, 1))  # Glowing eye
     
     # Shield
-    if facing_right:
-        pygame.draw.rect(surface, armor_dark, (2, 6, 3, 5))
-        pygame.draw.rect(surface, armor_color, (2, 7, 2, 3))
-    else:
-        pygame.draw.rect(surface, armor_dark, (11, 6, 3, 5))
-        pygame.draw.rect(surface, armor_color, (12, 7, 2, 3))
+    spec.rect(armor_dark, (2, 6, 3, 5))
+    spec.rect(armor_color, (2, 7, 2, 3))
     
     # Sword
     sword_color = LIGHT_SLATE
-    if facing_right:
-        pygame.draw.rect(surface, sword_color, (12, 4, 2, 6))
-        pygame.draw.rect(surface, sword_color, (13, 2, 1, 3))
-    else:
-        pygame.draw.rect(surface, sword_color, (2, 4, 2, 6))
-        pygame.draw.rect(surface, sword_color, (2, 2, 1, 3))
-    
+    spec.rect(sword_color, (12, 4, 2, 6))
+    spec.rect(sword_color, (13, 2, 1, 3))
+
     # Legs (armored)
     if frame % 2 == 0:
-        pygame.draw.rect(surface, armor_dark, (5, 13, 2, 3))
-        pygame.draw.rect(surface, armor_dark, (9, 13, 2, 3))
+        spec.rect(armor_dark, (5, 13, 2, 3))
+        spec.rect(armor_dark, (9, 13, 2, 3))
     else:
-        pygame.draw.rect(surface, armor_dark, (4, 13, 2, 3))
-        pygame.draw.rect(surface, armor_dark, (10, 13, 2, 3))
+        spec.rect(armor_dark, (4, 13, 2, 3))
+        spec.rect(armor_dark, (10, 13, 2, 3))
     
-    if not facing_right:
-        surface = pygame.transform.flip(surface, True, False)
-    
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda frame=0: (_cannon_frame(frame),))
 def create_cannon_sprite(frame=0):
     """Create Cannon (boss) sprite - the archenemy"""
     size = 24
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     # Cape
     cape_color = DARK_RED
-    pygame.draw.rect(surface, cape_color, (2, 6, 20, 14))
-    pygame.draw.rect(surface, RED, (4, 8, 16, 10))
+    spec.rect(cape_color, (2, 6, 20, 14))
+    spec.rect(RED, (4, 8, 16, 10))
     
     # Body (dark armor)
     armor_color = DARK_BLUE
     armor_accent = NAVY
-    pygame.draw.rect(surface, armor_color, (7, 6, 10, 10))
-    pygame.draw.rect(surface, armor_accent, (8, 7, 8, 8))
+    spec.rect(armor_color, (7, 6, 10, 10))
+    spec.rect(armor_accent, (8, 7, 8, 8))
     
     # Head (helmet with crown)
-    pygame.draw.rect(surface, armor_color, (8, 1, 8, 6))
-    pygame.draw.rect(surface, DARK_RED, (9, 3, 6, 3))  # Visor
+    spec.rect(armor_color, (8, 1, 8, 6))
+    spec.rect(DARK_RED, (9, 3, 6, 3))  # Visor
     
     # Crown spikes
-    pygame.draw.rect(surface, YELLOW, (8, 0, 2, 2))
-    pygame.draw.rect(surface, YELLOW, (11, 0, 2, 1))
-    pygame.draw.rect(surface, YELLOW, (14, 0, 2, 2))
+    spec.rect(YELLOW, (8, 0, 2, 2))
+    spec.rect(YELLOW, (11, 0, 2, 1))
+    spec.rect(YELLOW, (14, 0, 2, 2))
     
     # Evil eyes
-    pygame.draw.rect(surface, YELLOW, (10, 3, 1, 1))
-    pygame.draw.rect(surface, YELLOW, (13, 3, 1, 1))
+    spec.rect(YELLOW, (10, 3, 1, 1))
+    spec.rect(YELLOW, (13, 3, 1, 1))
     
     # Cannon arm (signature weapon)
     cannon_color = GRAY
     if frame % 30 < 15:
-        pygame.draw.rect(surface, cannon_color, (17, 8, 6, 4))
-        pygame.draw.rect(surface, DARK_BROWN, (16, 9, 2, 2))
-        pygame.draw.rect(surface, ORANGE, (22, 9, 2, 2))  # Charging
+        spec.rect(cannon_color, (17, 8, 6, 4))
+        spec.rect(DARK_BROWN, (16, 9, 2, 2))
+        spec.rect(ORANGE, (22, 9, 2, 2))  # Charging
     else:
-        pygame.draw.rect(surface, cannon_color, (17, 8, 6, 4))
-        pygame.draw.rect(surface, DARK_BROWN, (16, 9, 2, 2))
+        spec.rect(cannon_color, (17, 8, 6, 4))
+        spec.rect(DARK_BROWN, (16, 9, 2, 2))
     
     # Legs
-    pygame.draw.rect(surface, armor_color, (8, 16, 3, 6))
-    pygame.draw.rect(surface, armor_color, (13, 16, 3, 6))
-    pygame.draw.rect(surface, DARK_BROWN, (8, 21, 3, 2))
-    pygame.draw.rect(surface, DARK_BROWN, (13, 21, 3, 2))
+    spec.rect(armor_color, (8, 16, 3, 6))
+    spec.rect(armor_color, (13, 16, 3, 6))
+    spec.rect(DARK_BROWN, (8, 21, 3, 2))
+    spec.rect(DARK_BROWN, (13, 21, 3, 2))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda full=True, is_container=False: (bool(full), bool(is_container)))
 def create_heart_sprite(full=True, is_container=False):
     """Create heart sprite for health display"""
     size = 10
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     if is_container:
         color = YELLOW
@@ -402,34 +707,29 @@ def create_heart_sprite(full=True, is_container=False):
         color = GRAY
         outline = DARK_BROWN
     
-    # Heart shape
-    pygame.draw.rect(surface, outline, (1, 2, 3, 3))
-    pygame.draw.rect(surface, outline, (6, 2, 3, 3))
-    pygame.draw.rect(surface, outline, (0, 3, 2, 3))
-    pygame.draw.rect(surface, outline, (8, 3, 2, 3))
-    pygame.draw.rect(surface, outline, (2, 5, 6, 3))
-    pygame.draw.rect(surface, outline, (3, 8, 4, 1))
-    pygame.draw.rect(surface, outline, (4, 9, 2, 1))
-    
-    # Fill
-    pygame.draw.rect(surface, color, (2, 3, 2, 2))
-    pygame.draw.rect(surface, color, (6, 3, 2, 2))
-    pygame.draw.rect(surface, color, (1, 4, 2, 2))
-    pygame.draw.rect(surface, color, (7, 4, 2, 2))
-    pygame.draw.rect(surface, color, (3, 5, 4, 2))
-    pygame.draw.rect(surface, color, (4, 7, 2, 1))
-    
-    # Highlight
-    if full or is_container:
-        pygame.draw.rect(surface, WHITE, (2, 3, 1, 1))
-    
-    return scale_surface(surface)
+    # Heart shape: o = outline, f = fill, h = highlight
+    highlight = WHITE if full or is_container else color
+    spec.grid([
+        '..........',
+        '..........',
+        '.ooo..ooo.',
+        'oohf..ffoo',
+        'offf..fffo',
+        'offffffffo',
+        '..offffo..',
+        '..ooffoo..',
+        '...oooo...',
+        '....oo....',
+    ], {'o': outline, 'f': color, 'h': highlight})
+    
+    return spec
 
 
+@cached_sprite(lambda full=True, is_bottle=False: (bool(full), bool(is_bottle)))
 def create_magic_sprite(full=True, is_bottle=False):
     """Create magic point sprite (star/crystal)"""
     size = 10
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     if is_bottle:
         color = MAGENTA
@@ -442,54 +742,56 @@ def create_magic_sprite(full=True, is_bottle=False):
         outline = DARK_BROWN
     
     # Crystal/star shape
-    pygame.draw.rect(surface, outline, (4, 0, 2, 2))
-    pygame.draw.rect(surface, outline, (3, 2, 4, 2))
-    pygame.draw.rect(surface, outline, (0, 3, 10, 2))
-    pygame.draw.rect(surface, outline, (2, 5, 6, 2))
-    pygame.draw.rect(surface, outline, (3, 7, 4, 2))
-    pygame.draw.rect(surface, outline, (4, 9, 2, 1))
+    spec.rect(outline, (4, 0, 2, 2))
+    spec.rect(outline, (3, 2, 4, 2))
+    spec.rect(outline, (0, 3, 10, 2))
+    spec.rect(outline, (2, 5, 6, 2))
+    spec.rect(outline, (3, 7, 4, 2))
+    spec.rect(outline, (4, 9, 2, 1))
     
     # Fill
-    pygame.draw.rect(surface, color, (4, 1, 2, 1))
-    pygame.draw.rect(surface, color, (3, 3, 4, 1))
-    pygame.draw.rect(surface, color, (1, 4, 8, 1))
-    pygame.draw.rect(surface, color, (3, 5, 4, 1))
-    pygame.draw.rect(surface, color, (4, 6, 2, 2))
+    spec.rect(color, (4, 1, 2, 1))
+    spec.rect(color, (3, 3, 4, 1))
+    spec.rect(color, (1, 4, 8, 1))
+    spec.rect(color, (3, 5, 4, 1))
+    spec.rect(color, (4, 6, 2, 2))
     
     # Highlight
     if full or is_bottle:
-        pygame.draw.rect(surface, WHITE, (4, 3, 1, 1))
+        spec.rect(WHITE, (4, 3, 1, 1))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda food_type='food': (food_type,))
 def create_food_sprite(food_type='food'):
     """Create food item sprite"""
     size = 10
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     if food_type == 'feast':
         # Roasted chicken leg
-        pygame.draw.rect(surface, TAN, (2, 2, 6, 5))
-        pygame.draw.rect(surface, BEIGE, (3, 3, 4, 3))
-        pygame.draw.rect(surface, BROWN, (1, 6, 2, 3))  # Bone
-        pygame.draw.rect(surface, CREAM, (1, 8, 2, 1))
+        spec.rect(TAN, (2, 2, 6, 5))
+        spec.rect(BEIGE, (3, 3, 4, 3))
+        spec.rect(BROWN, (1, 6, 2, 3))  # Bone
+        spec.rect(CREAM, (1, 8, 2, 1))
     else:
         # Apple
-        pygame.draw.rect(surface, RED, (2, 3, 6, 5))
-        pygame.draw.rect(surface, RED, (3, 2, 4, 1))
-        pygame.draw.rect(surface, DARK_RED, (2, 6, 6, 2))
-        pygame.draw.rect(surface, BROWN, (4, 0, 2, 3))  # Stem
-        pygame.draw.rect(surface, GREEN, (5, 1, 2, 2))  # Leaf
-        pygame.draw.rect(surface, WHITE, (3, 3, 1, 1))  # Highlight
-    
-    return scale_surface(surface)
+        spec.rect(RED, (2, 3, 6, 5))
+        spec.rect(RED, (3, 2, 4, 1))
+        spec.rect(DARK_RED, (2, 6, 6, 2))
+        spec.rect(BROWN, (4, 0, 2, 3))  # Stem
+        spec.rect(GREEN, (5, 1, 2, 2))  # Leaf
+        spec.rect(WHITE, (3, 3, 1, 1))  # Highlight
+    
+    return spec
 
 
+@cached_sprite(lambda vial_type='magic_vial': (vial_type,))
 def create_magic_vial_sprite(vial_type='magic_vial'):
     """Create magic vial sprite"""
     size = 10
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     if vial_type == 'magic_potion':
         color = TEAL
@@ -499,71 +801,101 @@ def create_magic_vial_sprite(vial_type='magic_vial'):
         liquid = MAGENTA
     
     # Bottle
-    pygame.draw.rect(surface, LIGHT_GRAY, (3, 0, 4, 2))  # Cork
-    pygame.draw.rect(surface, LIGHT_SLATE, (2, 2, 6, 2))  # Neck
-    pygame.draw.rect(surface, LIGHT_SLATE, (1, 4, 8, 5))  # Body outline
+    spec.rect(LIGHT_GRAY, (3, 0, 4, 2))  # Cork
+    spec.rect(LIGHT_SLATE, (2, 2, 6, 2))  # Neck
+    spec.rect(LIGHT_SLATE, (1, 4, 8, 5))  # Body outline
     
     # Liquid
-    pygame.draw.rect(surface, color, (2, 5, 6, 3))
-    pygame.draw.rect(surface, liquid, (3, 6, 4, 2))
+    spec.rect(color, (2, 5, 6, 3))
+    spec.rect(liquid, (3, 6, 4, 2))
     
     # Highlight
-    pygame.draw.rect(surface, WHITE, (2, 4, 1, 2))
+    spec.rect(WHITE, (2, 4, 1, 2))
     
     # Sparkle
-    pygame.draw.rect(surface, WHITE, (5, 5, 1, 1))
+    spec.rect(WHITE, (5, 5, 1, 1))
     
-    return scale_surface(surface)
+    return spec
+
 
+@cached_sprite(lambda width=8: (width,))
+def create_coin_sprite(width=8):
+    """Create a coin sprite, squashed to width pixels to look like it spins"""
+    size = 10
+    spec = PixelSpec(size, size)
+    
+    x_offset = (size - width) // 2
+    spec.rect(YELLOW, (x_offset, 2, width, 6))
+    spec.rect(ORANGE, (x_offset, 6, width, 2))
+    
+    return spec
 
+
+@cached_sprite(lambda: ())
+def create_key_sprite():
+    """Create key item sprite"""
+    size = 12
+    spec = PixelSpec(size, size)
+    
+    spec.rect(YELLOW, (2, 2, 4, 4))
+    spec.rect(YELLOW, (4, 5, 2, 6))
+    spec.rect(YELLOW, (2, 8, 2, 2))
+    spec.rect(ORANGE, (3, 3, 2, 2))
+    
+    return spec
+
+
+@cached_sprite(lambda frame=0: (_flicker_frame(frame),))
 def create_fireball_sprite(frame=0):
     """Create fireball projectile sprite"""
     size = 10
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     # Core
-    pygame.draw.rect(surface, YELLOW, (3, 3, 4, 4))
-    pygame.draw.rect(surface, WHITE, (4, 4, 2, 2))
+    spec.rect(YELLOW, (3, 3, 4, 4))
+    spec.rect(WHITE, (4, 4, 2, 2))
     
     # Flames (animated)
     if frame % 4 < 2:
-        pygame.draw.rect(surface, ORANGE, (2, 2, 2, 2))
-        pygame.draw.rect(surface, ORANGE, (6, 2, 2, 2))
-        pygame.draw.rect(surface, ORANGE, (2, 6, 2, 2))
-        pygame.draw.rect(surface, ORANGE, (6, 6, 2, 2))
-        pygame.draw.rect(surface, RED, (1, 4, 2, 2))
+        spec.rect(ORANGE, (2, 2, 2, 2))
+        spec.rect(ORANGE, (6, 2, 2, 2))
+        spec.rect(ORANGE, (2, 6, 2, 2))
+        spec.rect(ORANGE, (6, 6, 2, 2))
+        spec.rect(RED, (1, 4, 2, 2))
     else:
-        pygame.draw.rect(surface, ORANGE, (1, 3, 2, 2))
-        pygame.draw.rect(surface, ORANGE, (7, 3, 2, 2))
-        pygame.draw.rect(surface, ORANGE, (1, 5, 2, 2))
-        pygame.draw.rect(surface, ORANGE, (7, 5, 2, 2))
-        pygame.draw.rect(surface, RED, (0, 4, 2, 2))
+        spec.rect(ORANGE, (1, 3, 2, 2))
+        spec.rect(ORANGE, (7, 3, 2, 2))
+        spec.rect(ORANGE, (1, 5, 2, 2))
+        spec.rect(ORANGE, (7, 5, 2, 2))
+        spec.rect(RED, (0, 4, 2, 2))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda frame=0: (_flicker_frame(frame),))
 def create_thunder_sprite(frame=0):
     """Create thunder effect sprite"""
     size = 16
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     # Lightning bolt shape
     color = YELLOW if frame % 4 < 2 else WHITE
     
-    pygame.draw.rect(surface, color, (8, 0, 3, 4))
-    pygame.draw.rect(surface, color, (6, 3, 4, 3))
-    pygame.draw.rect(surface, color, (4, 5, 6, 3))
-    pygame.draw.rect(surface, color, (6, 7, 4, 3))
-    pygame.draw.rect(surface, color, (8, 9, 3, 4))
-    pygame.draw.rect(surface, color, (10, 12, 2, 4))
+    spec.rect(color, (8, 0, 3, 4))
+    spec.rect(color, (6, 3, 4, 3))
+    spec.rect(color, (4, 5, 6, 3))
+    spec.rect(color, (6, 7, 4, 3))
+    spec.rect(color, (8, 9, 3, 4))
+    spec.rect(color, (10, 12, 2, 4))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda frame=0: (_shield_frame(frame),))
 def create_shield_effect_sprite(frame=0):
     """Create shield buff visual effect"""
     size = 20
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     # Shimmering shield
     alpha = 128 + int(64 * ((frame % 30) / 30))
@@ -574,212 +906,251 @@ def create_shield_effect_sprite(frame=0):
         angle_offset = (frame * 3 + i * 45) % 360
         x = int(10 + 7 * (1 if i % 2 == 0 else -1) * ((frame + i * 5) % 10) / 10)
         y = int(10 + 7 * (1 if i < 4 else -1) * ((frame + i * 5) % 10) / 10)
-        pygame.draw.rect(surface, CYAN, (x, y, 2, 2))
+        spec.rect(CYAN, (x, y, 2, 2))
     
     # Border
-    pygame.draw.rect(surface, TEAL, (0, 8, 2, 4))
-    pygame.draw.rect(surface, TEAL, (18, 8, 2, 4))
-    pygame.draw.rect(surface, TEAL, (8, 0, 4, 2))
-    pygame.draw.rect(surface, TEAL, (8, 18, 4, 2))
+    spec.rect(TEAL, (0, 8, 2, 4))
+    spec.rect(TEAL, (18, 8, 2, 4))
+    spec.rect(TEAL, (8, 0, 4, 2))
+    spec.rect(TEAL, (8, 18, 4, 2))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(_tile_key)
 def create_tile_sprite(tile_type, variant=0):
     """Create tile sprites for levels"""
     size = 16
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     if tile_type == 'grass':
-        pygame.draw.rect(surface, GREEN, (0, 0, 16, 16))
-        pygame.draw.rect(surface, LIME, (0, 0, 16, 4))
+        spec.rect(GREEN, (0, 0, 16, 16))
+        spec.rect(LIME, (0, 0, 16, 4))
         # Grass detail
         for i in range(4):
             x = (i * 4 + variant) % 16
-            pygame.draw.rect(surface, DARK_GREEN, (x, 4, 1, 2))
+            spec.rect(DARK_GREEN, (x, 4, 1, 2))
     
     elif tile_type == 'dirt':
-        pygame.draw.rect(surface, BROWN, (0, 0, 16, 16))
-        pygame.draw.rect(surface, TAN, (2, 2, 3, 2))
-        pygame.draw.rect(surface, TAN, (10, 8, 4, 3))
-        pygame.draw.rect(surface, DARK_BROWN, (6, 12, 2, 2))
+        spec.rect(BROWN, (0, 0, 16, 16))
+        spec.rect(TAN, (2, 2, 3, 2))
+        spec.rect(TAN, (10, 8, 4, 3))
+        spec.rect(DARK_BROWN, (6, 12, 2, 2))
     
     elif tile_type == 'stone':
-        pygame.draw.rect(surface, GRAY, (0, 0, 16, 16))
-        pygame.draw.rect(surface, LIGHT_GRAY, (1, 1, 6, 5))
-        pygame.draw.rect(surface, LIGHT_GRAY, (9, 8, 5, 6))
-        pygame.draw.rect(surface, DARK_BROWN, (0, 7, 16, 1))
-        pygame.draw.rect(surface, DARK_BROWN, (7, 0, 1, 16))
+        spec.rect(GRAY, (0, 0, 16, 16))
+        spec.rect(LIGHT_GRAY, (1, 1, 6, 5))
+        spec.rect(LIGHT_GRAY, (9, 8, 5, 6))
+        spec.rect(DARK_BROWN, (0, 7, 16, 1))
+        spec.rect(DARK_BROWN, (7, 0, 1, 16))
     
     elif tile_type == 'brick':
-        pygame.draw.rect(surface, DARK_RED, (0, 0, 16, 16))
+        spec.rect(DARK_RED, (0, 0, 16, 16))
         # Brick pattern
-        pygame.draw.rect(surface, RED, (1, 1, 6, 6))
-        pygame.draw.rect(surface, RED, (9, 1, 6, 6))
-        pygame.draw.rect(surface, RED, (1, 9, 14, 6))
-        pygame.draw.rect(surface, BROWN, (0, 7, 16, 2))
-        pygame.draw.rect(surface, BROWN, (7, 0, 2, 8))
+        spec.rect(RED, (1, 1, 6, 6))
+        spec.rect(RED, (9, 1, 6, 6))
+        spec.rect(RED, (1, 9, 14, 6))
+        spec.rect(BROWN, (0, 7, 16, 2))
+        spec.rect(BROWN, (7, 0, 2, 8))
     
     elif tile_type == 'wood':
-        pygame.draw.rect(surface, BROWN, (0, 0, 16, 16))
+        spec.rect(BROWN, (0, 0, 16, 16))
         # Wood grain
         for i in range(4):
             y = i * 4 + 1
-            pygame.draw.rect(surface, TAN, (0, y, 16, 2))
-        pygame.draw.rect(surface, DARK_BROWN, (4, 0, 1, 16))
-        pygame.draw.rect(surface, DARK_BROWN, (11, 0, 1, 16))
+            spec.rect(TAN, (0, y, 16, 2))
+        spec.rect(DARK_BROWN, (4, 0, 1, 16))
+        spec.rect(DARK_BROWN, (11, 0, 1, 16))
     
     elif tile_type == 'water':
         base = TEAL if variant % 2 == 0 else SKY_BLUE
-        pygame.draw.rect(surface, base, (0, 0, 16, 16))
+        spec.rect(base, (0, 0, 16, 16))
         # Waves
         wave_color = CYAN
         for i in range(3):
             x = (i * 6 + variant * 2) % 16
-            pygame.draw.rect(surface, wave_color, (x, 4, 4, 1))
-            pygame.draw.rect(surface, wave_color, ((x + 3) % 16, 10, 4, 1))
+            spec.rect(wave_color, (x, 4, 4, 1))
+            spec.rect(wave_color, ((x + 3) % 16, 10, 4, 1))
     
     elif tile_type == 'lava':
-        pygame.draw.rect(surface, DARK_RED, (0, 0, 16, 16))
-        pygame.draw.rect(surface, RED, (2, 2, 5, 4))
-        pygame.draw.rect(surface, RED, (9, 7, 5, 5))
-        pygame.draw.rect(surface, ORANGE, (3, 3, 2, 2))
-        pygame.draw.rect(surface, ORANGE, (10, 9, 3, 2))
-        pygame.draw.rect(surface, YELLOW, (4, 3, 1, 1))
+        spec.rect(DARK_RED, (0, 0, 16, 16))
+        spec.rect(RED, (2, 2, 5, 4))
+        spec.rect(RED, (9, 7, 5, 5))
+        spec.rect(ORANGE, (3, 3, 2, 2))
+        spec.rect(ORANGE, (10, 9, 3, 2))
+        spec.rect(YELLOW, (4, 3, 1, 1))
     
     elif tile_type == 'sky':
-        pygame.draw.rect(surface, SKY_BLUE, (0, 0, 16, 16))
+        spec.rect(SKY_BLUE, (0, 0, 16, 16))
         if variant % 3 == 0:
             # Cloud
-            pygame.draw.rect(surface, WHITE, (2, 4, 8, 4))
-            pygame.draw.rect(surface, WHITE, (4, 2, 4, 2))
+            spec.rect(WHITE, (2, 4, 8, 4))
+            spec.rect(WHITE, (4, 2, 4, 2))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda tile_type: (tile_type,))
 def create_world_map_tile(tile_type):
     """Create tiles for the world map"""
     size = 16
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     if tile_type == 'grass':
-        pygame.draw.rect(surface, GREEN, (0, 0, 16, 16))
-        pygame.draw.rect(surface, LIME, (3, 3, 2, 2))
-        pygame.draw.rect(surface, LIME, (10, 8, 2, 2))
-        pygame.draw.rect(surface, DARK_GREEN, (7, 12, 2, 2))
+        spec.rect(GREEN, (0, 0, 16, 16))
+        spec.rect(LIME, (3, 3, 2, 2))
+        spec.rect(LIME, (10, 8, 2, 2))
+        spec.rect(DARK_GREEN, (7, 12, 2, 2))
     
     elif tile_type == 'forest':
-        pygame.draw.rect(surface, DARK_GREEN, (0, 0, 16, 16))
+        spec.rect(DARK_GREEN, (0, 0, 16, 16))
         # Trees
-        pygame.draw.rect(surface, GREEN, (2, 4, 4, 6))
-        pygame.draw.rect(surface, GREEN, (10, 2, 4, 8))
-        pygame.draw.rect(surface, BROWN, (3, 10, 2, 4))
-        pygame.draw.rect(surface, BROWN, (11, 10, 2, 4))
+        spec.rect(GREEN, (2, 4, 4, 6))
+        spec.rect(GREEN, (10, 2, 4, 8))
+        spec.rect(BROWN, (3, 10, 2, 4))
+        spec.rect(BROWN, (11, 10, 2, 4))
     
     elif tile_type == 'mountain':
-        pygame.draw.rect(surface, GRAY, (0, 0, 16, 16))
+        spec.rect(GRAY, (0, 0, 16, 16))
         # Mountain peak
-        pygame.draw.rect(surface, SLATE, (6, 0, 4, 6))
-        pygame.draw.rect(surface, SLATE, (4, 6, 8, 4))
-        pygame.draw.rect(surface, SLATE, (2, 10, 12, 6))
-        pygame.draw.rect(surface, WHITE, (7, 1, 2, 3))  # Snow cap
+        spec.rect(SLATE, (6, 0, 4, 6))
+        spec.rect(SLATE, (4, 6, 8, 4))
+        spec.rect(SLATE, (2, 10, 12, 6))
+        spec.rect(WHITE, (7, 1, 2, 3))  # Snow cap
     
     elif tile_type == 'water':
-        pygame.draw.rect(surface, NAVY, (0, 0, 16, 16))
-        pygame.draw.rect(surface, TEAL, (2, 4, 6, 2))
-        pygame.draw.rect(surface, TEAL, (8, 10, 6, 2))
+        spec.rect(NAVY, (0, 0, 16, 16))
+        spec.rect(TEAL, (2, 4, 6, 2))
+        spec.rect(TEAL, (8, 10, 6, 2))
     
     elif tile_type == 'path':
         # Full path tile that connects in all directions
-        pygame.draw.rect(surface, TAN, (0, 0, 16, 16))
+        spec.rect(TAN, (0, 0, 16, 16))
         # Add some texture/detail
-        pygame.draw.rect(surface, BEIGE, (2, 2, 4, 4))
-        pygame.draw.rect(surface, BEIGE, (10, 10, 4, 4))
-        pygame.draw.rect(surface, BROWN, (7, 6, 2, 2))
-        pygame.draw.rect(surface, BROWN, (1, 12, 2, 2))
-        pygame.draw.rect(surface, BROWN, (12, 2, 2, 2))
+        spec.rect(BEIGE, (2, 2, 4, 4))
+        spec.rect(BEIGE, (10, 10, 4, 4))
+        spec.rect(BROWN, (7, 6, 2, 2))
+        spec.rect(BROWN, (1, 12, 2, 2))
+        spec.rect(BROWN, (12, 2, 2, 2))
     
     elif tile_type == 'castle':
-        pygame.draw.rect(surface, GRAY, (0, 0, 16, 16))
+        spec.rect(GRAY, (0, 0, 16, 16))
         # Castle structure
-        pygame.draw.rect(surface, SLATE, (2, 4, 12, 12))
-        pygame.draw.rect(surface, SLATE, (0, 2, 4, 4))
-        pygame.draw.rect(surface, SLATE, (12, 2, 4, 4))
-        pygame.draw.rect(surface, DARK_BLUE, (6, 10, 4, 6))  # Door
-        pygame.draw.rect(surface, RED, (2, 0, 2, 3))  # Flag
+        spec.rect(SLATE, (2, 4, 12, 12))
+        spec.rect(SLATE, (0, 2, 4, 4))
+        spec.rect(SLATE, (12, 2, 4, 4))
+        spec.rect(DARK_BLUE, (6, 10, 4, 6))  # Door
+        spec.rect(RED, (2, 0, 2, 3))  # Flag
     
     elif tile_type == 'cave':
-        pygame.draw.rect(surface, DARK_BROWN, (0, 0, 16, 16))
-        pygame.draw.rect(surface, BLACK, (4, 6, 8, 10))
-        pygame.draw.rect(surface, DARK_BROWN, (2, 4, 12, 4))
+        spec.rect(DARK_BROWN, (0, 0, 16, 16))
+        spec.rect(BLACK, (4, 6, 8, 10))
+        spec.rect(DARK_BROWN, (2, 4, 12, 4))
     
     elif tile_type == 'fortress':
         # Cannon's Domain entrance - dark fortress
-        pygame.draw.rect(surface, DARK_BLUE, (0, 0, 16, 16))
+        spec.rect(DARK_BLUE, (0, 0, 16, 16))
         # Fortress walls
-        pygame.draw.rect(surface, NAVY, (1, 2, 14, 14))
-        pygame.draw.rect(surface, DARK_BROWN, (3, 4, 10, 10))
+        spec.rect(NAVY, (1, 2, 14, 14))
+        spec.rect(DARK_BROWN, (3, 4, 10, 10))
         # Gate
-        pygame.draw.rect(surface, BLACK, (5, 8, 6, 8))
+        spec.rect(BLACK, (5, 8, 6, 8))
         # Spikes on top
-        pygame.draw.rect(surface, GRAY, (2, 1, 2, 4))
-        pygame.draw.rect(surface, GRAY, (7, 1, 2, 4))
-        pygame.draw.rect(surface, GRAY, (12, 1, 2, 4))
+        spec.rect(GRAY, (2, 1, 2, 4))
+        spec.rect(GRAY, (7, 1, 2, 4))
+        spec.rect(GRAY, (12, 1, 2, 4))
         # Red glow
-        pygame.draw.rect(surface, RED, (6, 9, 4, 2))
+        spec.rect(RED, (6, 9, 4, 2))
     
     elif tile_type == 'boss':
-        pygame.draw.rect(surface, DARK_RED, (0, 0, 16, 16))
+        spec.rect(DARK_RED, (0, 0, 16, 16))
         # Evil castle
-        pygame.draw.rect(surface, DARK_BLUE, (2, 4, 12, 12))
-        pygame.draw.rect(surface, DARK_BLUE, (0, 2, 4, 4))
-        pygame.draw.rect(surface, DARK_BLUE, (12, 2, 4, 4))
-        pygame.draw.rect(surface, BLACK, (6, 10, 4, 6))
-        pygame.draw.rect(surface, YELLOW, (4, 6, 2, 2))  # Evil eye
-        pygame.draw.rect(surface, YELLOW, (10, 6, 2, 2))  # Evil eye
+        spec.rect(DARK_BLUE, (2, 4, 12, 12))
+        spec.rect(DARK_BLUE, (0, 2, 4, 4))
+        spec.rect(DARK_BLUE, (12, 2, 4, 4))
+        spec.rect(BLACK, (6, 10, 4, 6))
+        spec.rect(YELLOW, (4, 6, 2, 2))  # Evil eye
+        spec.rect(YELLOW, (10, 6, 2, 2))  # Evil eye
     
     elif tile_type == 'level_marker':
-        pygame.draw.rect(surface, YELLOW, (4, 4, 8, 8))
-        pygame.draw.rect(surface, ORANGE, (6, 6, 4, 4))
+        spec.rect(YELLOW, (4, 4, 8, 8))
+        spec.rect(ORANGE, (6, 6, 4, 4))
     
-    return scale_surface(surface)
+    return spec
 
 
+@cached_sprite(lambda facing='down', frame=0: (facing, _world_walk_frame(frame)))
 def create_chain_world_sprite(facing='down', frame=0):
     """Create Chain sprite for world map (top-down view)"""
     size = 12
-    surface = create_pixel_surface(size, size)
+    spec = PixelSpec(size, size)
     
     # Body
-    pygame.draw.rect(surface, TEAL, (3, 3, 6, 6))
+    spec.rect(TEAL, (3, 3, 6, 6))
     
     # Head direction
     skin = BEIGE
     hair = NAVY
     
     if facing == 'down':
-        pygame.draw.rect(surface, hair, (4, 2, 4, 2))
-        pygame.draw.rect(surface, skin, (4, 4, 4, 3))
-        pygame.draw.rect(surface, DARK_BLUE, (5, 5, 1, 1))
-        pygame.draw.rect(surface, DARK_BLUE, (7, 5, 1, 1))
+        spec.rect(hair, (4, 2, 4, 2))
+        spec.rect(skin, (4, 4, 4, 3))
+        spec.rect(DARK_BLUE, (5, 5, 1, 1))
+        spec.rect(DARK_BLUE, (7, 5, 1, 1))
     elif facing == 'up':
-        pygame.draw.rect(surface, hair, (4, 2, 4, 4))
-        pygame.draw.rect(surface, skin, (5, 5, 2, 2))
+        spec.rect(hair, (4, 2, 4, 4))
+        spec.rect(skin, (5, 5, 2, 2))
     elif facing == 'left':
-        pygame.draw.rect(surface, hair, (3, 2, 4, 3))
-        pygame.draw.rect(surface, skin, (3, 4, 3, 3))
-        pygame.draw.rect(surface, DARK_BLUE, (3, 5, 1, 1))
+        spec.rect(hair, (3, 2, 4, 3))
+        spec.rect(skin, (3, 4, 3, 3))
+        spec.rect(DARK_BLUE, (3, 5, 1, 1))
     elif facing == 'right':
-        pygame.draw.rect(surface, hair, (5, 2, 4, 3))
-        pygame.draw.rect(surface, skin, (6, 4, 3, 3))
-        pygame.draw.rect(surface, DARK_BLUE, (8, 5, 1, 1))
+        spec.rect(hair, (5, 2, 4, 3))
+        spec.rect(skin, (6, 4, 3, 3))
+        spec.rect(DARK_BLUE, (8, 5, 1, 1))
     
     # Feet (animated)
     if frame % 20 < 10:
-        pygame.draw.rect(surface, BROWN, (3, 9, 2, 2))
-        pygame.draw.rect(surface, BROWN, (7, 9, 2, 2))
+        spec.rect(BROWN, (3, 9, 2, 2))
+        spec.rect(BROWN, (7, 9, 2, 2))
     else:
-        pygame.draw.rect(surface, BROWN, (4, 9, 2, 2))
-        pygame.draw.rect(surface, BROWN, (6, 9, 2, 2))
+        spec.rect(BROWN, (4, 9, 2, 2))
+        spec.rect(BROWN, (6, 9, 2, 2))
     
-    return scale_surface(surface)
+    return spec
+
+
+# Every animated sprite by kind and pose: (factory, takes facing, takes frame)
+SPRITE_POSES = {
+    'chain': {
+        'walk': (create_chain_sprite, True, True),
+        'attack': (create_chain_attack_sprite, True, False),
+        'attack_up': (create_chain_up_attack_sprite, True, False),
+        'attack_down': (create_chain_down_attack_sprite, True, False),
+        'world': (create_chain_world_sprite, True, True),
+    },
+    'slime': {'hop': (create_slime_sprite, False, True)},
+    'bat': {'fly': (create_bat_sprite, False, True)},
+    'knight': {'walk': (create_knight_sprite, True, True)},
+    'cannon': {'idle': (create_cannon_sprite, False, True)},
+    'fireball': {'fly': (create_fireball_sprite, False, True)},
+    'thunder': {'strike': (create_thunder_sprite, False, True)},
+    'shield': {'shimmer': (create_shield_effect_sprite, False, True)},
+}
+
+
+def get_sprite(kind, pose, facing=True, frame=0):
+    """
+    Look up a cached sprite for an entity.
+    
+    facing is facing_right for side-view sprites, and a direction ('up',
+    'down', 'left', 'right') for Chain's world map sprite. It is ignored by
+    sprites that don't turn. Left-facing side views are mirrored from the
+    right-facing pose.
+    """
+    factory, takes_facing, takes_frame = SPRITE_POSES[kind][pose]
+    if takes_facing:
+        if takes_frame:
+            return factory(facing, frame)
+        return factory(facing)
+    return factory(frame)
@@ -269,6 +269,19 @@ class UI:
             introspect.draw(surface, option_text, option_rect.topleft, f"ui_menu_option_{option.lower().replace(' ', '_')}",
                            {"option": option, "index": i, "selected": is_selected})
     
+    def draw_loading(self, surface, progress):
+        """Draw the asset loading progress bar"""
+        bar_rect = pygame.Rect(SCREEN_WIDTH // 2 - 120, SCREEN_HEIGHT - 60, 240, 12)
+        fill_rect = pygame.Rect(bar_rect.x, bar_rect.y, int(bar_rect.width * progress), bar_rect.height)
+        pygame.draw.rect(surface, DARK_BLUE, bar_rect)
+        pygame.draw.rect(surface, CYAN, fill_rect)
+        pygame.draw.rect(surface, WHITE, bar_rect, 1)
+        introspect.track_region(bar_rect, "ui_loading_bar", {"progress": round(progress, 2)})
+        
+        text = self.font_tiny.render(f"Loading... {int(progress * 100)}%", True, LIGHT_GRAY)
+        text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, bar_rect.y - 14))
+        introspect.draw(surface, text, text_rect.topleft, "ui_loading_text")
+    
     def draw_game_over(self, surface, score):
         """Draw game over screen"""
         # Darken background
@@ -4,7 +4,7 @@ World Map for traversing between adventures
 
 import pygame
 from settings import *
-from sprites import create_world_map_tile
+from sprites import create_world_map_tile, tinted_sprite
 from introspection import introspect
 
 
@@ -27,13 +27,17 @@ class WorldMapTile:
         )
         self.grid_x = x
         self.grid_y = y
+        
+        # Map tiles never change, so their introspection data is built once
+        self.introspect_name = f"world_tile_{tile_type}"
+        self.introspect_metadata = {"tile_type": tile_type, "grid_x": x, "grid_y": y,
+                                    "walkable": walkable}
     
     def draw(self, surface, camera_offset=(0, 0)):
         draw_x = self.rect.x - camera_offset[0]
         draw_y = self.rect.y - camera_offset[1]
-        introspect.draw(surface, self.image, (draw_x, draw_y), f"world_tile_{self.tile_type}",
-                       {"tile_type": self.tile_type, "grid_x": self.grid_x, "grid_y": self.grid_y,
-                        "walkable": self.walkable})
+        introspect.draw(surface, self.image, (draw_x, draw_y), self.introspect_name,
+                       self.introspect_metadata)
 
 
 class LevelMarker:
@@ -78,9 +82,7 @@ class LevelMarker:
         # Draw marker
         if self.completed:
             # Completed levels show as green
-            completed_img = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-            completed_img.blit(self.image, (0, 0))
-            completed_img.fill((*LIME[:3], 100), special_flags=pygame.BLEND_RGBA_ADD)
+            completed_img = tinted_sprite(self.image, LIME)
             introspect.draw(surface, completed_img, (draw_x, draw_y + pulse), 
                            f"level_marker_{self.level_id}",
                            {"level_id": self.level_id, "level_name": self.level_name,
@@ -97,6 +99,7 @@ class WorldMap:
     
     def __init__(self):
         self.tiles = []
+        self.grid = []  # Rows of tiles (None where there is none), for culling
         self.level_markers = []
         self.map_width = WORLD_MAP_WIDTH
         self.map_height = WORLD_MAP_HEIGHT
@@ -150,11 +153,15 @@ class WorldMap:
         
         # Create tiles
         for y, row in enumerate(map_data):
+            grid_row = []
             for x, char in enumerate(row):
+                tile = None
                 if char in tile_map:
                     tile_type, walkable = tile_map[char]
                     tile = WorldMapTile(x, y, tile_type, walkable)
                     self.tiles.append(tile)
+                grid_row.append(tile)
+            self.grid.append(grid_row)
         
         # Create level markers - progression through the world
         self.level_markers = [
@@ -226,14 +233,16 @@ class WorldMap:
         """Draw the world map"""
         camera_offset = (int(self.camera_x), int(self.camera_y))
         
-        # Draw tiles
-        for tile in self.tiles:
-            # Only draw visible tiles
-            if (tile.rect.x - camera_offset[0] > -TILE_SIZE * PIXEL_SCALE and
-                tile.rect.x - camera_offset[0] < SCREEN_WIDTH + TILE_SIZE * PIXEL_SCALE and
-                tile.rect.y - camera_offset[1] > -TILE_SIZE * PIXEL_SCALE and
-                tile.rect.y - camera_offset[1] < SCREEN_HEIGHT + TILE_SIZE * PIXEL_SCALE):
-                tile.draw(surface, camera_offset)
+        # Draw only the rows and columns of tiles under the camera
+        tile_size = 16 * PIXEL_SCALE
+        col_start = max(camera_offset[0] // tile_size, 0)
+        col_end = (camera_offset[0] + SCREEN_WIDTH - 1) // tile_size + 1
+        row_start = max(camera_offset[1] // tile_size, 0)
+        row_end = (camera_offset[1] + SCREEN_HEIGHT - 1) // tile_size + 1
+        for row in self.grid[row_start:row_end]:
+            for tile in row[col_start:col_end]:
+                if tile:
+                    tile.draw(surface, camera_offset)
         
         # Draw level markers
         for marker in self.level_markers: